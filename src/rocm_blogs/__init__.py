@@ -4,14 +4,21 @@ __init__.py for the rocm_blogs package.
 """
 
 import functools
+import hashlib
+import heapq
 import importlib.resources as pkg_resources
+import io
+import itertools
 import json
+import operator
 import os
-import pathlib
 import threading
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict
+from concurrent.futures import (FIRST_COMPLETED, ThreadPoolExecutor, as_completed,
+                                wait)
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -51,6 +58,18 @@ except ImportError:
         PERFORMANCE = "performance"
 
 
+try:
+    import orjson
+
+    def _dumps_json(data):
+        """Serialize data to a JSON string using orjson."""
+        return orjson.dumps(data).decode("utf-8")
+
+except ImportError:
+    # Fallback to the standard library encoder if orjson is not available
+    _dumps_json = json.dumps
+
+
 from ._rocmblogs import ROCmBlogs
 from ._version import __version__
 from .banner import *
@@ -58,8 +77,9 @@ from .constants import *
 from .images import *
 from .logger.logger import *
 from .metadata import *
-from .process import (_create_pagination_controls, _generate_grid_items,
-                      _generate_lazy_loaded_grid_items, _process_category,
+from .process import (_compile_page_template, _create_pagination_controls,
+                      _generate_grid_items, _generate_lazy_loaded_grid_items,
+                      _process_category, _write_page_files,
                       process_single_blog)
 from .project.project_info import append_to_universal_log, log_project_info
 from .utils import *
@@ -75,7 +95,18 @@ __all__ = [
 
 
 structured_logger = None
-if LOGGING_AVAILABLE and is_logging_enabled():
+
+# Set by setup() so that importing the package has no side effects
+_initialized = False
+
+
+def _initialize_structured_logging() -> None:
+    """Initialize the structured logger from the environment."""
+    global structured_logger
+
+    if not (LOGGING_AVAILABLE and is_logging_enabled()):
+        return
+
     try:
         log_file_path = Path("logs/rocm_blogs.log")
         structured_logger = configure_logging(
@@ -95,13 +126,253 @@ if LOGGING_AVAILABLE and is_logging_enabled():
         print(f"Failed to initialize structured logging: {logging_error}")
         structured_logger = None
 
-        
+
 _CRITICAL_ERROR_OCCURRED = False
 
-_BUILD_START_TIME = time.time()
+_BUILD_START_TIME = None
 
 _BUILD_PHASES = {"setup": 0, "update_index": 0, "blog_generation": 0, "other": 0}
 
+@dataclass(slots=True)
+class _ErrorDetail:
+    """A blog, page or category that failed during a phase, for its log summary."""
+
+    name: str
+    error: str
+
+
+# Blogs without a date sort after every dated blog when ordering newest first
+_UNDATED_SORT_DATE = datetime.min
+
+_blog_sort_date = operator.attrgetter("_sort_date")
+
+
+def _sort_blogs_newest_first(blogs):
+    """Sort blogs newest first by their precomputed sort dates."""
+    return sorted(_with_sort_dates(blogs), key=_blog_sort_date, reverse=True)
+
+
+def _iter_page_grid_items(grid_items, items_per_page):
+    """Yield the grid items of each page in turn, slicing one page at a time."""
+    grid_item_iterator = iter(grid_items)
+    while page_grid_items := list(itertools.islice(grid_item_iterator, items_per_page)):
+        yield page_grid_items
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pagination_assets():
+    """Read the pagination template and stylesheets shared by the paginated pages once."""
+    return (
+        import_file("rocm_blogs.templates", "pagination.html"),
+        import_file("rocm_blogs.static.css", "index.css"),
+        import_file("rocm_blogs.static.css", "pagination.css"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_index_template():
+    """Read the index page template and its stylesheets and combine them once."""
+    return INDEX_TEMPLATE.format(
+        CSS=import_file("rocm_blogs.static.css", "index.css"),
+        BANNER_CSS=import_file("rocm_blogs.static.css", "banner-slider.css"),
+        HTML=import_file("rocm_blogs.templates", "index.html"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_vertical_template(template_string):
+    """Parse and compile the vertical page Jinja2 template once per template source."""
+    return Template(template_string)
+
+
+def _with_sort_dates(blogs):
+    """Yield blogs with the date they sort by precomputed, so sort keys are attribute reads."""
+    for blog in blogs:
+        blog_date = getattr(blog, "date", None)
+        blog._sort_date = blog_date if blog_date is not None else _UNDATED_SORT_DATE
+        yield blog
+
+
+def _generate_newest_grid_items(
+    rocm_blogs, blogs, max_items, candidate_count, used_blogs, grid_cache
+):
+    """Build a grid from the newest candidate_count blogs with sort dates set.
+
+    If the grid comes out short because some candidates failed to render, it
+    is topped up from all of the blogs, newest first; every blog already
+    tried was added to used_blogs, so only untried blogs are rendered.
+    """
+    candidates = heapq.nlargest(candidate_count, blogs, key=_blog_sort_date)
+    grid_items = _generate_grid_items(
+        rocm_blogs, candidates, max_items, used_blogs, True, False, grid_cache
+    )
+
+    if len(grid_items) < max_items and len(blogs) > len(candidates):
+        grid_items += _generate_grid_items(
+            rocm_blogs,
+            sorted(blogs, key=_blog_sort_date, reverse=True),
+            max_items - len(grid_items),
+            used_blogs,
+            True,
+            False,
+            grid_cache,
+        )
+
+    return grid_items
+
+
+# Author page images copied so far, keyed by (source path, mtime_ns, size)
+_copied_author_images = set()
+_copied_author_images_lock = threading.Lock()
+
+
+def _copy_author_images(blogs, blogs_directory, created_directories):
+    """Copy blog images into authors/images, skipping sources already copied unchanged."""
+    for blog in blogs:
+        for image in blog.image_paths:
+            image_path = Path(image)
+            try:
+                image_stat = image_path.stat()
+            except OSError:
+                continue
+
+            image_key = (str(image_path), image_stat.st_mtime_ns, image_stat.st_size)
+            destination_path = blogs_directory / f"authors/images/{image}"
+
+            # Authors are updated concurrently and may share blogs, so claim
+            # each image under the lock and copy it outside of it
+            with _copied_author_images_lock:
+                if image_key in _copied_author_images and destination_path.exists():
+                    continue
+                _copied_author_images.add(image_key)
+
+                if destination_path.parent not in created_directories:
+                    destination_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_directories.add(destination_path.parent)
+
+            try:
+                shutil.copyfile(image_path, destination_path)
+            except OSError:
+                with _copied_author_images_lock:
+                    _copied_author_images.discard(image_key)
+                raise
+
+
+def _list_author_page_slugs(blogs_directory):
+    """Return the slugs of the author pages in the authors directory."""
+    try:
+        with os.scandir(os.path.join(blogs_directory, "authors")) as entries:
+            return frozenset(
+                entry.name[:-3] for entry in entries if entry.name.endswith(".md")
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=None)
+def _author_slug(author):
+    """Return the file name stem of an author's page."""
+    return author.replace(" ", "-").lower()
+
+
+def _incremental_build_enabled():
+    """Check whether the ROCM_BLOGS_INCREMENTAL environment variable is set."""
+    return os.environ.get("ROCM_BLOGS_INCREMENTAL", "").lower() in ("true", "1", "yes")
+
+
+# Digest of the index phase inputs, stored next to index.md
+_INDEX_BUILD_HASH_FILE = ".index_build_hash"
+
+
+def _index_inputs_digest(blogs_directory, readme_stats):
+    """Hash the path, mtime and size of every file the index phase reads.
+
+    README stat results come from the directory scan that found them. Image
+    directories are included so that new WebP thumbnails, which change the
+    rendered grid items, also invalidate the digest, as are the author pages
+    that grid items link to. The package version covers changes to the code
+    that renders the page.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{__version__}\0".encode())
+    for readme_path in sorted(readme_stats):
+        readme_mtime_ns, readme_size = readme_stats[readme_path]
+        digest.update(f"{readme_path}\0{readme_mtime_ns}\0{readme_size}\0".encode())
+
+    package_directory = Path(__file__).parent
+    input_paths = [
+        os.path.join(blogs_directory, "featured-blogs.csv"),
+        os.path.join(blogs_directory, "images"),
+    ]
+    input_paths.extend(
+        os.path.join(os.path.dirname(readme_path), "images")
+        for readme_path in sorted(readme_stats)
+    )
+    input_paths.extend(
+        os.path.join(blogs_directory, "authors", f"{author_slug}.md")
+        for author_slug in sorted(_list_author_page_slugs(blogs_directory))
+    )
+    for resource_directory in ("templates", "static/css"):
+        input_paths.extend(
+            sorted(
+                str(path) for path in (package_directory / resource_directory).iterdir()
+            )
+        )
+
+    for input_path in input_paths:
+        try:
+            stat_result = os.stat(input_path)
+        except OSError:
+            digest.update(f"{input_path}\0missing\0".encode())
+            continue
+        digest.update(
+            f"{input_path}\0{stat_result.st_mtime_ns}\0{stat_result.st_size}\0".encode()
+        )
+    return digest.hexdigest()
+
+
+def _author_grid_inputs_digest(author_blogs, blogs_directory, author_css):
+    """Hash the content of every input that goes into an author page's grid.
+
+    README bytes are hashed rather than their stat results, and image
+    directories contribute their file names, so a checkout or a rewrite that
+    only touches mtimes does not force the grid to be regenerated.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{__version__}\0{author_css}\0".encode())
+    image_directories = [os.path.join(blogs_directory, "images")]
+    for blog in author_blogs:
+        digest.update(f"{blog.file_path}\0".encode())
+        digest.update(Path(blog.file_path).read_bytes())
+        image_directories.append(
+            os.path.join(os.path.dirname(blog.file_path), "images")
+        )
+
+    for image_directory in image_directories:
+        try:
+            image_names = sorted(os.listdir(image_directory))
+        except OSError:
+            image_names = []
+        digest.update(f"{image_directory}\0".encode())
+        digest.update("\0".join(image_names).encode())
+    return digest.hexdigest()
+
+
+def _split_author_page(author_content):
+    """Split an author page into its hand-written part and its grid digest.
+
+    The digest is None for a page that has no generated section yet.
+    """
+    marker_match = AUTHOR_GRID_MARKER_PATTERN.search(author_content)
+    if not marker_match:
+        return author_content, None
+
+    # Drop the newline that was added in front of the generated section
+    handwritten_content = author_content[: marker_match.start()]
+    if handwritten_content.endswith("\n"):
+        handwritten_content = handwritten_content[:-1]
+    return handwritten_content, marker_match.group(1)
+
 
 def log_total_build_time(sphinx_app, build_exception):
     """Log the total time taken for the entire build process."""
@@ -147,6 +418,9 @@ def log_total_build_time(sphinx_app, build_exception):
             "log_total_build_time",
         )
         raise
+    finally:
+        # Nothing else is logged for this build, so write out the queued records
+        stop_log_listener()
 
 
 def _create_build_timing_summary_file(total_elapsed_time, phases_to_display):
@@ -323,7 +597,7 @@ def log_time(func):
             execution_time = time.time() - function_start_time
             log_message(
                 "info",
-                "{func.__name__} completed in \033[96m{execution_time:.4f} seconds\033[0m",
+                f"{func.__name__} completed in \033[96m{execution_time:.4f} seconds\033[0m",
                 "general",
                 "__init__",
             )
@@ -340,294 +614,362 @@ def log_time(func):
     return wrapper
 
 
-def update_author_files(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
-    """Update author files with blog information."""
-
-    global _CRITICAL_ERROR_OCCURRED
-    phase_start_time = time.time()
-    phase_name = "update_author_files"
-
-    # find author files
-
-    rocm_blogs.find_author_files()
-    rocm_blogs.blogs.blogs_authors
+def _process_author(
+    rocm_blogs,
+    author,
+    author_log,
+    author_css,
+    author_page_slugs,
+    blogs_directory,
+    created_image_directories,
+    grid_cache,
+    critical_error,
+):
+    """Update a single author's page with their blogs."""
+    log_message("info", f"Processing author: {author}", "general", "__init__")
 
-    log_filepath, log_file_handle = create_step_log_file(phase_name)
+    # COMPREHENSIVE AUTHOR DEBUGGING - START
+    safe_log_write(author_log, f"\n" + "=" * 80 + "\n")
+    safe_log_write(author_log, f"Preparing grid generation for author [{author}]\n")
+    safe_log_write(author_log, f"=" * 80 + "\n")
 
-    safe_log_write(log_file_handle, f"Starting {phase_name} process\n")
+    name = _author_slug(author)
 
-    for blog in rocm_blogs.blogs.get_blogs():
-        safe_log_write(log_file_handle, f"Blog: {blog}\n")
+    author_file_path = blogs_directory / f"authors/{name}.md"
 
-    log_message(
-        "info",
-        "Author files to be updated: {rocm_blogs.author_paths}",
-        "general",
-        "__init__",
-    )
+    if name not in author_page_slugs:
+        log_message(
+            "warning",
+            f"Author file not found: {author_file_path}",
+            "general",
+            "__init__",
+        )
+        safe_log_write(
+            author_log, f"WARNING: Author file not found: {author_file_path}\n"
+        )
+    else:
+        log_message(
+            "info",
+            f"Updating author file: {author_file_path}",
+            "general",
+            "__init__",
+        )
+        safe_log_write(author_log, f"Updating author file: {author_file_path}\n")
 
-    log_message(
-        "info", "Authors found: {rocm_blogs.blogs.blogs_authors}", "general", "__init__"
-    )
+        # Get all blogs by author and filter to only include actual blog posts
+        all_author_blogs = rocm_blogs.blogs.get_blogs_by_author(author)
+        author_blogs = []
+        skipped_count = 0
 
-    for author in rocm_blogs.blogs.blogs_authors:
-        log_message("info", f"Processing author: {author}", "general", "__init__")
+        for blog in all_author_blogs:
+            # Check if this is a genuine blog post (has the blogpost flag set to true)
+            if blog.blogpost:
+                author_blogs.append(blog)
+                safe_log_write(
+                    author_log,
+                    f"Including blog for author [{author}]: {getattr(blog, 'file_path', 'Unknown')}\n",
+                )
+            else:
+                skipped_count += 1
+                safe_log_write(
+                    author_log,
+                    f"Skipping non-blog README file for author [{author}]: {getattr(blog, 'file_path', 'Unknown')}\n",
+                )
 
-        # COMPREHENSIVE AUTHOR DEBUGGING - START
-        safe_log_write(log_file_handle, f"\n" + "=" * 80 + "\n")
+        log_message(
+            "info",
+            f"Filtered out {skipped_count} non-blog README files for author [{author}], kept {len(author_blogs)} genuine blog posts",
+            "general",
+            "__init__",
+        )
         safe_log_write(
-            log_file_handle, f"Preparing grid generation for author [{author}]\n"
+            author_log,
+            f"Filtered out {skipped_count} non-blog README files for author [{author}], kept {len(author_blogs)} genuine blog posts\n",
         )
-        safe_log_write(log_file_handle, f"=" * 80 + "\n")
 
-        name = "-".join(author.split(" ")).lower()
+        with author_file_path.open("r", encoding="utf-8") as author_file:
+            author_content, generated_digest = _split_author_page(author_file.read())
 
-        author_file_path = Path(rocm_blogs.blogs_directory) / f"authors/{name}.md"
-
-        if not author_file_path.exists():
+        grid_inputs_digest = _author_grid_inputs_digest(
+            author_blogs, blogs_directory, author_css
+        )
+        if _incremental_build_enabled() and generated_digest == grid_inputs_digest:
             log_message(
-                "warning",
-                f"Author file not found: {author_file_path}",
+                "info",
+                f"Author file is up to date, skipping: {author_file_path}",
                 "general",
                 "__init__",
             )
             safe_log_write(
-                log_file_handle, f"WARNING: Author file not found: {author_file_path}\n"
+                author_log, f"Skipping up-to-date author file: {author_file_path}\n"
             )
-        else:
-            log_message(
-                "info",
-                "Updating author file: {author_file_path}",
-                "general",
-                "__init__",
+            return
+
+        # Log the blogs for this author
+        blog_titles = [
+            getattr(blog, "blog_title", "Unknown Title") for blog in author_blogs
+        ]
+        safe_log_write(author_log, f"[{author}] has these blogs: {blog_titles}\n")
+        safe_log_write(
+            author_log,
+            f"Total blog count for [{author}]: {len(author_blogs)}\n\n",
+        )
+
+        author_blogs = sorted(
+            _with_sort_dates(author_blogs), key=_blog_sort_date, reverse=True
+        )
+
+        # DETAILED BLOG OBJECT INSPECTION
+        safe_log_write(author_log, f"DETAILED BLOG INSPECTION FOR AUTHOR [{author}]:\n")
+        safe_log_write(author_log, f"-" * 80 + "\n")
+
+        for i, blog in enumerate(author_blogs):
+            safe_log_write(author_log, f"\nBLOG #{i+1} DETAILED INSPECTION:\n")
+            safe_log_write(
+                author_log,
+                f"Blog Title: {getattr(blog, 'blog_title', 'NO TITLE')}\n",
             )
             safe_log_write(
-                log_file_handle, f"Updating author file: {author_file_path}\n"
+                author_log,
+                f"File Path: {getattr(blog, 'file_path', 'NO FILE PATH')}\n",
             )
 
-            with author_file_path.open("r", encoding="utf-8") as author_file:
-                author_content = author_file.read()
+            # Print ALL attributes of the blog object
+            safe_log_write(author_log, f"\nALL BLOG ATTRIBUTES:\n")
+            for attr_name in dir(blog):
+                if not attr_name.startswith("_"):  # Skip private attributes
+                    try:
+                        attr_value = getattr(blog, attr_name)
+                        if not callable(attr_value):  # Skip methods
+                            safe_log_write(
+                                author_log,
+                                f"  {attr_name}: {repr(attr_value)}\n",
+                            )
+                    except Exception as attr_error:
+                        safe_log_write(
+                            author_log,
+                            f"  {attr_name}: ERROR - {attr_error}\n",
+                        )
 
-            # Get all blogs by author and filter to only include actual blog posts
-            all_author_blogs = rocm_blogs.blogs.get_blogs_by_author(author)
-            author_blogs = []
-            skipped_count = 0
+            # Print the complete metadata structure
+            safe_log_write(author_log, f"\nCOMPLETE METADATA STRUCTURE:\n")
+            if hasattr(blog, "metadata") and blog.metadata:
+                try:
+                    import json
 
-            for blog in all_author_blogs:
-                # Check if this is a genuine blog post (has the blogpost flag set to true)
-                if hasattr(blog, "blogpost") and blog.blogpost:
-                    author_blogs.append(blog)
+                    metadata_json = json.dumps(blog.metadata, indent=4, default=str)
+                    safe_log_write(author_log, f"{metadata_json}\n")
+                except Exception as json_error:
                     safe_log_write(
-                        log_file_handle,
-                        f"Including blog for author [{author}]: {getattr(blog, 'file_path', 'Unknown')}\n",
-                    )
-                else:
-                    skipped_count += 1
-                    safe_log_write(
-                        log_file_handle,
-                        f"Skipping non-blog README file for author [{author}]: {getattr(blog, 'file_path', 'Unknown')}\n",
+                        author_log,
+                        f"ERROR serializing metadata: {json_error}\n",
                     )
+                    safe_log_write(author_log, f"Raw metadata: {repr(blog.metadata)}\n")
+            else:
+                safe_log_write(author_log, f"NO METADATA FOUND\n")
 
+            # Test the OpenGraph functions directly
+            safe_log_write(author_log, f"\nTESTING OPENGRAPH FUNCTIONS:\n")
+            try:
+                og_image = blog.grab_og_image()
+                safe_log_write(author_log, f"grab_og_image() returned: {og_image}\n")
+            except Exception as og_image_error:
+                safe_log_write(author_log, f"grab_og_image() ERROR: {og_image_error}\n")
+
+            try:
+                og_href = blog.grab_og_href()
+                safe_log_write(author_log, f"grab_og_href() returned: {og_href}\n")
+            except Exception as og_href_error:
+                safe_log_write(author_log, f"grab_og_href() ERROR: {og_href_error}\n")
+
+            try:
+                og_description = blog.grab_og_description()
+                safe_log_write(
+                    author_log,
+                    f"grab_og_description() returned: {og_description[:100]}...\n",
+                )
+            except Exception as og_desc_error:
+                safe_log_write(
+                    author_log,
+                    f"grab_og_description() ERROR: {og_desc_error}\n",
+                )
+
+            safe_log_write(author_log, f"\n" + "-" * 60 + "\n")
+
+        safe_log_write(
+            author_log,
+            f"\nCalling _generate_grid_items with use_og=True for author [{author}]\n",
+        )
+        safe_log_write(author_log, f"=" * 80 + "\n\n")
+        # COMPREHENSIVE AUTHOR DEBUGGING - END
+
+        author_grid_items = _generate_grid_items(
+            rocm_blogs, author_blogs, 999, [], False, True, grid_cache
+        )
+
+        # copy all blog images to authors/images directory
+        _copy_author_images(author_blogs, blogs_directory, created_image_directories)
+        try:
             log_message(
                 "info",
-                f"Filtered out {skipped_count} non-blog README files for author [{author}], kept {len(author_blogs)} genuine blog posts",
+                f"Generating grid items for author: {author}",
                 "general",
                 "__init__",
             )
-            safe_log_write(
-                log_file_handle,
-                f"Filtered out {skipped_count} non-blog README files for author [{author}], kept {len(author_blogs)} genuine blog posts\n",
+
+            # The marker records the grid inputs and lets the next build
+            # replace this section instead of appending another one
+            author_content = (
+                author_content
+                + "\n"
+                + AUTHOR_GRID_MARKER.format(digest=grid_inputs_digest)
+                + AUTHOR_TEMPLATE
             )
 
-            # Log the blogs for this author
-            blog_titles = [
-                getattr(blog, "blog_title", "Unknown Title") for blog in author_blogs
-            ]
-            safe_log_write(
-                log_file_handle, f"[{author}] has these blogs: {blog_titles}\n"
+            # Fill every placeholder in a single pass over the page
+            placeholder_values = {
+                "author_blogs": "".join(author_grid_items),
+                "author": author,
+                "author_css": author_css,
+            }
+            updated_author_content = AUTHOR_PLACEHOLDER_PATTERN.sub(
+                lambda match: placeholder_values[match.group(1)], author_content
             )
-            safe_log_write(
-                log_file_handle,
-                f"Total blog count for [{author}]: {len(author_blogs)}\n\n",
+            if "{author_blogs}" in updated_author_content:
+                log_message(
+                    "warning",
+                    f"Error: replacement failed for {author_file_path}",
+                    "general",
+                    "__init__",
+                )
+            else:
+                log_message(
+                    "info",
+                    f"Successfully updated author file: {author_file_path}",
+                    "general",
+                    "__init__",
+                )
+        except Exception as error:
+            log_message(
+                "error",
+                f"Error processing author file: {error}",
+                "general",
+                "__init__",
             )
+            log_message(
+                "debug",
+                f"Traceback: {traceback.format_exc()}",
+                "general",
+                "__init__",
+            )
+            critical_error.set()
+            raise ROCmBlogsError(f"Error processing author file: {error}")
 
-            author_blogs.sort(key=lambda x: x.date, reverse=True)
+        write_file_if_changed(author_file_path, updated_author_content.encode("utf-8"))
 
-            # DETAILED BLOG OBJECT INSPECTION
-            safe_log_write(
-                log_file_handle, f"DETAILED BLOG INSPECTION FOR AUTHOR [{author}]:\n"
+        if author_content != updated_author_content:
+            log_message(
+                "info",
+                f"Author file updated successfully: {author_file_path}",
+                "general",
+                "__init__",
+            )
+        else:
+            log_message(
+                "warning",
+                f"Author file content unchanged: {author_file_path}",
+                "general",
+                "__init__",
             )
-            safe_log_write(log_file_handle, f"-" * 80 + "\n")
 
-            for i, blog in enumerate(author_blogs):
-                safe_log_write(log_file_handle, f"\nBLOG #{i+1} DETAILED INSPECTION:\n")
-                safe_log_write(
-                    log_file_handle,
-                    f"Blog Title: {getattr(blog, 'blog_title', 'NO TITLE')}\n",
-                )
-                safe_log_write(
-                    log_file_handle,
-                    f"File Path: {getattr(blog, 'file_path', 'NO FILE PATH')}\n",
-                )
 
-                # Print ALL attributes of the blog object
-                safe_log_write(log_file_handle, f"\nALL BLOG ATTRIBUTES:\n")
-                for attr_name in dir(blog):
-                    if not attr_name.startswith("_"):  # Skip private attributes
-                        try:
-                            attr_value = getattr(blog, attr_name)
-                            if not callable(attr_value):  # Skip methods
-                                safe_log_write(
-                                    log_file_handle,
-                                    f"  {attr_name}: {repr(attr_value)}\n",
-                                )
-                        except Exception as attr_error:
-                            safe_log_write(
-                                log_file_handle,
-                                f"  {attr_name}: ERROR - {attr_error}\n",
-                            )
+def update_author_files(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
+    """Update author files with blog information."""
 
-                # Print the complete metadata structure
-                safe_log_write(log_file_handle, f"\nCOMPLETE METADATA STRUCTURE:\n")
-                if hasattr(blog, "metadata") and blog.metadata:
-                    try:
-                        import json
+    global _CRITICAL_ERROR_OCCURRED
+    phase_start_time = time.time()
+    phase_name = "update_author_files"
 
-                        metadata_json = json.dumps(blog.metadata, indent=4, default=str)
-                        safe_log_write(log_file_handle, f"{metadata_json}\n")
-                    except Exception as json_error:
-                        safe_log_write(
-                            log_file_handle,
-                            f"ERROR serializing metadata: {json_error}\n",
-                        )
-                        safe_log_write(
-                            log_file_handle, f"Raw metadata: {repr(blog.metadata)}\n"
-                        )
-                else:
-                    safe_log_write(log_file_handle, f"NO METADATA FOUND\n")
+    # find author files
 
-                # Test the OpenGraph functions directly
-                safe_log_write(log_file_handle, f"\nTESTING OPENGRAPH FUNCTIONS:\n")
-                try:
-                    og_image = blog.grab_og_image()
-                    safe_log_write(
-                        log_file_handle, f"grab_og_image() returned: {og_image}\n"
-                    )
-                except Exception as og_image_error:
-                    safe_log_write(
-                        log_file_handle, f"grab_og_image() ERROR: {og_image_error}\n"
-                    )
+    rocm_blogs.find_author_files()
+    author_css = import_file("rocm_blogs.static.css", "index.css")
 
-                try:
-                    og_href = blog.grab_og_href()
-                    safe_log_write(
-                        log_file_handle, f"grab_og_href() returned: {og_href}\n"
-                    )
-                except Exception as og_href_error:
-                    safe_log_write(
-                        log_file_handle, f"grab_og_href() ERROR: {og_href_error}\n"
-                    )
+    log_filepath, log_file_handle = create_step_log_file(phase_name)
 
-                try:
-                    og_description = blog.grab_og_description()
-                    safe_log_write(
-                        log_file_handle,
-                        f"grab_og_description() returned: {og_description[:100]}...\n",
-                    )
-                except Exception as og_desc_error:
-                    safe_log_write(
-                        log_file_handle,
-                        f"grab_og_description() ERROR: {og_desc_error}\n",
-                    )
+    safe_log_write(log_file_handle, f"Starting {phase_name} process\n")
+
+    if log_file_handle:
+        safe_log_write(
+            log_file_handle,
+            "".join(f"Blog: {blog}\n" for blog in rocm_blogs.blogs.get_blogs()),
+        )
+
+    log_message(
+        "info",
+        f"Author files to be updated: {rocm_blogs.author_paths}",
+        "general",
+        "__init__",
+    )
 
-                safe_log_write(log_file_handle, f"\n" + "-" * 60 + "\n")
+    log_message(
+        "info",
+        f"Authors found: {rocm_blogs.blogs.blogs_authors}",
+        "general",
+        "__init__",
+    )
 
-            safe_log_write(
-                log_file_handle,
-                f"\nCalling _generate_grid_items with use_og=True for author [{author}]\n",
-            )
-            safe_log_write(log_file_handle, f"=" * 80 + "\n\n")
-            # COMPREHENSIVE AUTHOR DEBUGGING - END
+    blogs_directory = Path(rocm_blogs.blogs_directory)
+    created_image_directories = set()
+    # Co-authored blogs appear on several author pages; render each one once
+    author_grid_cache = {}
+    # List the author pages once instead of probing each author's file
+    author_page_slugs = _list_author_page_slugs(blogs_directory)
 
-            author_grid_items = _generate_grid_items(
-                rocm_blogs, author_blogs, 999, [], False, True
-            )
+    # Authors write separate pages, so update them concurrently. Each author
+    # logs to its own buffer, which is written out in author order.
+    authors = list(rocm_blogs.blogs.blogs_authors)
+    author_logs = [io.StringIO() if log_file_handle else None for _ in authors]
+    critical_error = threading.Event()
 
-            # copy all blog images to authors/images directory
-            for blog in author_blogs:
-                blog_images = blog.image_paths
-                for image in blog_images:
-                    image_path = Path(image)
-                    if image_path.exists():
-                        destination_path = (
-                            Path(rocm_blogs.blogs_directory) / f"authors/images/{image}"
-                        )
-                        destination_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy(image_path, destination_path)
-            try:
-                log_message(
-                    "info",
-                    "Generating grid items for author: {author}",
-                    "general",
-                    "__init__",
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4)
+        ) as executor:
+            list(
+                executor.map(
+                    functools.partial(
+                        _process_author,
+                        rocm_blogs,
+                        author_css=author_css,
+                        author_page_slugs=author_page_slugs,
+                        blogs_directory=blogs_directory,
+                        created_image_directories=created_image_directories,
+                        grid_cache=author_grid_cache,
+                        critical_error=critical_error,
+                    ),
+                    authors,
+                    author_logs,
                 )
+            )
+    finally:
+        if critical_error.is_set():
+            _CRITICAL_ERROR_OCCURRED = True
 
-                author_css = import_file("rocm_blogs.static.css", "index.css")
-
-                author_content = author_content + "\n" + AUTHOR_TEMPLATE
+        for author_log in author_logs:
+            if author_log is not None:
+                safe_log_write(log_file_handle, author_log.getvalue())
 
-                updated_author_content = (
-                    author_content.replace("{author_blogs}", "".join(author_grid_items))
-                    .replace("{author}", author)
-                    .replace("{author_css}", author_css)
-                )
-                if "{author_blogs}" in updated_author_content:
-                    log_message(
-                        "warning",
-                        f"Error: replacement failed for {author_file_path}",
-                        "general",
-                        "__init__",
-                    )
-                else:
-                    log_message(
-                        "info",
-                        "Successfully updated author file: {author_file_path}",
-                        "general",
-                        "__init__",
-                    )
-            except Exception as error:
-                log_message(
-                    "error",
-                    f"Error processing author file: {error}",
-                    "general",
-                    "__init__",
-                )
-                log_message(
-                    "debug",
-                    f"Traceback: {traceback.format_exc()}",
-                    "general",
-                    "__init__",
-                )
-                _CRITICAL_ERROR_OCCURRED = True
-                raise ROCmBlogsError(f"Error processing author file: {error}")
+        safe_log_close(log_file_handle)
 
-            with author_file_path.open("w", encoding="utf-8") as author_file:
-                author_file.write(updated_author_content)
 
-                if author_content != updated_author_content:
-                    log_message(
-                        "info",
-                        "Author file updated successfully: {author_file_path}",
-                        "general",
-                        "__init__",
-                    )
-                else:
-                    log_message(
-                        "warning",
-                        f"Author file content unchanged: {author_file_path}",
-                        "general",
-                        "__init__",
-                    )
+def _statistics_blog_entry(blog):
+    """Return the title, date and link shown for a blog in the author table."""
+    return {
+        "title": blog.blog_title,
+        "date": blog.date.strftime("%B %d, %Y") if blog.date else "N/A",
+        "href": blog.grab_og_href(),
+    }
 
 
 def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
@@ -670,16 +1012,17 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         # Filter blogs to only include real blog posts
         filtered_blogs = []
         skipped_count = 0
+        # Collect the per-blog log lines and write them in one call
+        filter_log_lines = []
 
         for blog in all_blogs:
             # Check if this is a genuine blog post (has the blogpost flag set
             # to true)
-            if hasattr(blog, "blogpost") and blog.blogpost:
+            if blog.blogpost:
                 filtered_blogs.append(blog)
                 if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Including blog: {getattr(blog, 'file_path', 'Unknown')}\n",
+                    filter_log_lines.append(
+                        f"Including blog: {getattr(blog, 'file_path', 'Unknown')}\n"
                     )
             else:
                 skipped_count += 1
@@ -690,11 +1033,12 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                     "__init__",
                 )
                 if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Skipping non-blog README file: {getattr(blog, 'file_path', 'Unknown')}\n",
+                    filter_log_lines.append(
+                        f"Skipping non-blog README file: {getattr(blog, 'file_path', 'Unknown')}\n"
                     )
 
+        safe_log_write(log_file_handle, "".join(filter_log_lines))
+
         log_message(
             "info",
             f"Filtered out {skipped_count} non-blog README files for statistics page, kept {len(filtered_blogs)} genuine blog posts",
@@ -725,12 +1069,12 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, "Generating author statistics\n")
 
+        # List the author pages once rather than checking each author's file
+        author_page_slugs = _list_author_page_slugs(rocm_blogs.blogs_directory)
+
         for author, blogs in rocm_blogs.blogs.blogs_authors.items():
             # Filter to only include genuine blog posts with blogpost flag
-            genuine_blogs = [
-                blog for blog in blogs 
-                if hasattr(blog, "blogpost") and blog.blogpost
-            ]
+            genuine_blogs = [blog for blog in blogs if blog.blogpost]
             
             if not genuine_blogs:
                 log_message(
@@ -745,13 +1089,12 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                         f"INFO: No genuine blog posts found for author: {author} (had {len(blogs)} non-blog READMEs)\n",
                     )
                 continue
-            sorted_blogs = sorted(
-                genuine_blogs, key=lambda b: b.date if b.date else datetime.min, reverse=True
-            )
-
-            # Get latest and first blog
-            latest_blog = sorted_blogs[0] if sorted_blogs else None
-            first_blog = sorted_blogs[-1] if sorted_blogs else None
+            # Get latest and first blog without sorting all of them. Among
+            # equally dated blogs, keep the picks a stable newest-first sort
+            # would make.
+            dated_blogs = list(_with_sort_dates(genuine_blogs))
+            latest_blog = max(dated_blogs, key=_blog_sort_date)
+            first_blog = min(reversed(dated_blogs), key=_blog_sort_date)
 
             if author == "No author":
                 author = "ROCm Blogs Team"
@@ -759,48 +1102,26 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             safe_log_write(log_file_handle, f"Processing author: {author}\n")
 
             # check if author has a page
-            if pathlib.Path.exists(
-                Path(rocm_blogs.blogs_directory)
-                / f"authors/{author.replace(' ', '-').lower()}.md"
-            ):
-                author_link = f"https://rocm.blogs.amd.com/authors/{author.replace(' ', '-').lower()}.html"
+            author_slug = _author_slug(author)
+            if author_slug in author_page_slugs:
+                author_link = f"https://rocm.blogs.amd.com/authors/{author_slug}.html"
             else:
                 author_link = "None"
 
             safe_log_write(log_file_handle, f"Author link: {author_link}\n")
 
             # Create author statistics
-
-            author_stat = {
-                "name": {
-                    "name": author,
-                    "href": author_link.format(author=author.replace(" ", "-").lower()),
-                },
-                "blog_count": len(genuine_blogs),
-                "latest_blog": {
-                    "title": latest_blog.blog_title if latest_blog else "N/A",
-                    "date": (
-                        latest_blog.date.strftime("%B %d, %Y")
-                        if latest_blog and latest_blog.date
-                        else "N/A"
-                    ),
-                    "href": latest_blog.grab_og_href() if latest_blog else "#",
-                },
-                "first_blog": {
-                    "title": first_blog.blog_title if first_blog else "N/A",
-                    "date": (
-                        first_blog.date.strftime("%B %d, %Y")
-                        if first_blog and first_blog.date
-                        else "N/A"
-                    ),
-                    "href": first_blog.grab_og_href() if first_blog else "#",
-                },
-            }
-
-            if author_link == "None":
-                author_stat["name"]["href"] = ""
-
-            author_stats.append(author_stat)
+            author_stats.append(
+                {
+                    "name": {
+                        "name": author,
+                        "href": "" if author_link == "None" else author_link,
+                    },
+                    "blog_count": len(genuine_blogs),
+                    "latest_blog": _statistics_blog_entry(latest_blog),
+                    "first_blog": _statistics_blog_entry(first_blog),
+                }
+            )
 
         # Sort authors by blog count (descending)
         author_stats.sort(key=lambda x: x["blog_count"], reverse=True)
@@ -816,50 +1137,69 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
 
         for author_stat in author_stats:
             author_name = author_stat["name"]
-            blog_count = author_stat["blog_count"]
             latest_blog = author_stat["latest_blog"]
             first_blog = author_stat["first_blog"]
 
-            # Create author name cell
-
-            if author_name["href"]:
-                author_cell = f'<td class="author"><a href="{author_name["href"]}">{author_name["name"]}</a></td>'
-            else:
-                author_cell = f'<td class="author">{author_name["name"]}</td>'
-
-            blog_count_cell = f'<td class="blog-count">{blog_count}</td>'
-
-            latest_blog_cell = f'<td class="date"><a href="{latest_blog["href"]}" class="blog-title">{latest_blog["title"]}</a><br><span class="date-text">{latest_blog["date"]}</span></td>'
-
-            first_blog_cell = f'<td class="date"><a href="{first_blog["href"]}" class="blog-title">{first_blog["title"]}</a><br><span class="date-text">{first_blog["date"]}</span></td>'
-
-            # Combine cells into a row
-            row = f"<tr>{author_cell}{blog_count_cell}{latest_blog_cell}{first_blog_cell}</tr>"
-            author_rows.append(row)
+            row_template = (
+                STATISTICS_LINKED_AUTHOR_ROW_TEMPLATE
+                if author_name["href"]
+                else STATISTICS_AUTHOR_ROW_TEMPLATE
+            )
+            author_rows.append(
+                row_template.format_map(
+                    {
+                        "name": author_name["name"],
+                        "href": author_name["href"],
+                        "blog_count": author_stat["blog_count"],
+                        "latest_href": latest_blog["href"],
+                        "latest_title": latest_blog["title"],
+                        "latest_date": latest_blog["date"],
+                        "first_href": first_blog["href"],
+                        "first_title": first_blog["title"],
+                        "first_date": first_blog["date"],
+                    }
+                )
+            )
 
         if log_file_handle:
             safe_log_write(
                 log_file_handle, f"Generated {len(author_rows)} author table rows\n"
             )
 
-        # Generate monthly blog data
+        # Count blogs by month, category and tag in a single pass
         if log_file_handle:
-            safe_log_write(log_file_handle, "Generating monthly blog data\n")
+            safe_log_write(
+                log_file_handle, "Counting blogs by month, category and tag\n"
+            )
 
-        # Count blogs by month
-        monthly_counts = {}
+        monthly_counts = Counter()
+        category_counts = Counter()
+        tag_counts = Counter()
 
         for blog in all_blogs:
-            if hasattr(blog, "date") and blog.date:
-                month_key = blog.date.strftime("%Y-%m")
-                monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
+            blog_date = getattr(blog, "date", None)
+            if blog_date:
+                monthly_counts[blog_date.strftime("%Y-%m")] += 1
+
+            category_counts[blog.category or "Uncategorized"] += 1
+
+            blog_tags = getattr(blog, "tags", None)
+            if blog_tags:
+                # Handle tags as a list or as a comma-separated string
+                if not isinstance(blog_tags, list):
+                    blog_tags = [tag.strip() for tag in blog_tags.split(",")]
+                tag_counts.update(tag for tag in blog_tags if tag)
+
+        # Generate monthly blog data
+        if log_file_handle:
+            safe_log_write(log_file_handle, "Generating monthly blog data\n")
 
         # Get all months of data
-        sorted_months = sorted(monthly_counts.keys())
+        sorted_months = sorted(monthly_counts)
 
         # Format month labels
         monthly_labels = [
-            datetime.strptime(month, "%Y-%m").strftime("%b %Y")
+            f"{MONTH_ABBREVIATIONS[int(month[5:7]) - 1]} {month[:4]}"
             for month in sorted_months
         ]
         monthly_data = [monthly_counts[month] for month in sorted_months]
@@ -876,27 +1216,13 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, "Generating category distribution data\n")
 
-        # Count blogs by category
-        category_counts = {}
-
-        for blog in all_blogs:
-            if hasattr(blog, "category") and blog.category:
-                category = blog.category
-                category_counts[category] = category_counts.get(category, 0) + 1
-            else:
-                category_counts["Uncategorized"] = (
-                    category_counts.get("Uncategorized", 0) + 1
-                )
-
-        # Sort categories by count (descending)
-        sorted_categories = sorted(
-            category_counts.items(), key=lambda x: x[1], reverse=True
-        )
-
-        # Combine small categories into "Other" if there are too many
-        if len(sorted_categories) > 6:
-            main_categories = sorted_categories[:5]
-            other_count = sum(count for _, count in sorted_categories[5:])
+        # Combine small categories into "Other" if there are too many. Only
+        # the largest ones need ordering, which most_common does with a heap.
+        if len(category_counts) > 6:
+            main_categories = category_counts.most_common(5)
+            other_count = category_counts.total() - sum(
+                count for _, count in main_categories
+            )
 
             category_labels = [category for category, _ in main_categories]
             category_data = [count for _, count in main_categories]
@@ -905,6 +1231,8 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 category_labels.append("Other")
                 category_data.append(other_count)
         else:
+            # Sort categories by count (descending)
+            sorted_categories = category_counts.most_common()
             category_labels = [category for category, _ in sorted_categories]
             category_data = [count for _, count in sorted_categories]
 
@@ -916,62 +1244,14 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 f"Generated category distribution data with {len(category_distribution['labels'])} categories\n",
             )
 
-        # Generate monthly blog data
-        if log_file_handle:
-            safe_log_write(log_file_handle, "Generating monthly blog data\n")
-
-        # Count blogs by month
-        monthly_counts = {}
-
-        for blog in all_blogs:
-            if hasattr(blog, "date") and blog.date:
-                month_key = blog.date.strftime("%Y-%m")
-                monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-
-        # Get all months of data
-        sorted_months = sorted(monthly_counts.keys())
-
-        # Format month labels
-        monthly_labels = [
-            datetime.strptime(month, "%Y-%m").strftime("%b %Y")
-            for month in sorted_months
-        ]
-        monthly_data = [monthly_counts[month] for month in sorted_months]
-
-        monthly_blog_data = {"labels": monthly_labels, "data": monthly_data}
-
-        if log_file_handle:
-            safe_log_write(
-                log_file_handle,
-                f"Generated monthly blog data with {len(monthly_blog_data['labels'])} months\n",
-            )
-
         # Generate tag distribution data
         if log_file_handle:
             safe_log_write(log_file_handle, "Generating tag distribution data\n")
 
-        # Count blogs by tag
-        tag_counts = {}
-
-        for blog in all_blogs:
-            if hasattr(blog, "tags") and blog.tags:
-                # Handle tags as a list or as a comma-separated string
-                if isinstance(blog.tags, list):
-                    tags = blog.tags
-                else:
-                    tags = [tag.strip() for tag in blog.tags.split(",")]
-
-                for tag in tags:
-                    if tag:  # Skip empty tags
-                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        # Sort tags by count (descending)
-        sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-
         # Combine small tags into "Other" if there are too many
-        if len(sorted_tags) > 15:
-            main_tags = sorted_tags[:15]
-            other_count = sum(count for _, count in sorted_tags[15:])
+        if len(tag_counts) > 15:
+            main_tags = tag_counts.most_common(15)
+            other_count = tag_counts.total() - sum(count for _, count in main_tags)
 
             tag_labels = [tag for tag, _ in main_tags]
             tag_data = [count for _, count in main_tags]
@@ -980,6 +1260,8 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 tag_labels.append("Other")
                 tag_data.append(other_count)
         else:
+            # Sort tags by count (descending)
+            sorted_tags = tag_counts.most_common()
             tag_labels = [tag for tag, _ in sorted_tags]
             tag_data = [count for _, count in sorted_tags]
 
@@ -1003,15 +1285,14 @@ def blog_statistics(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, "Replacing placeholders in the template\n")
 
+        # Each placeholder appears once. Filling the later one first means
+        # neither replace has to scan the inserted author rows.
         updated_html = blog_statistics_template.replace(
-            "{author_rows}", "\n".join(author_rows)
-        )
-        updated_html = updated_html.replace(
-            "{statistics_data}", json.dumps(statistics_data)
-        )
+            "{statistics_data}", _dumps_json(statistics_data), 1
+        ).replace("{author_rows}", "\n".join(author_rows), 1)
 
-        # Create the statistics page content
-        statistics_template = """---
+        # Create the statistics page header; the CSS and HTML follow it
+        statistics_header = """---
 title: ROCm Blogs Statistics
 myst:
   html_meta:
@@ -1023,15 +1304,8 @@ myst:
 # ROCm Blogs Statistics
 
 <style>
-{CSS}
-</style>
-{HTML}
 """
 
-        final_content = statistics_template.format(
-            CSS=blog_statistics_css, HTML=updated_html
-        )
-
         # Write the statistics page
         output_path = Path(rocm_blogs.blogs_directory) / "blog_statistics.md"
 
@@ -1040,15 +1314,25 @@ myst:
                 log_file_handle, f"Writing statistics page to {output_path}\n"
             )
 
-        with output_path.open("w", encoding="utf-8") as output_file:
-            output_file.write(final_content)
+        # Join the sections and encode once so the page is a single write
+        output_path.write_bytes(
+            "".join(
+                (
+                    statistics_header,
+                    blog_statistics_css,
+                    "\n</style>\n",
+                    updated_html,
+                    "\n",
+                )
+            ).encode("utf-8")
+        )
 
         # Record timing information
         phase_duration = time.time() - phase_start_time
         _BUILD_PHASES["blog_statistics"] = phase_duration
         log_message(
             "info",
-            "Successfully generated blog statistics page at {output_path} in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Successfully generated blog statistics page at {output_path} in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -1062,13 +1346,14 @@ myst:
     except Exception as stats_error:
         error_message = f"Failed to generate blog statistics page: {stats_error}"
         log_message("error", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
         _BUILD_PHASES["blog_statistics"] = time.time() - phase_start_time
         _CRITICAL_ERROR_OCCURRED = True
@@ -1093,8 +1378,9 @@ myst:
 def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
     """Update the index file with new blog posts"""
     global _CRITICAL_ERROR_OCCURRED
-    phase_start_time = time.time()
+    phase_start_time = time.perf_counter()
     phase_name = "update_index"
+    phase_duration = None
 
     # Create a log file for this step
     log_filepath, log_file_handle = create_step_log_file(phase_name)
@@ -1112,7 +1398,7 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
 
     def track_operation_time(operation_name, start_time):
         """Track timing for individual operations within update_index_file."""
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         operation_timings[operation_name] = duration
         log_message(
             "info",
@@ -1132,10 +1418,8 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             safe_log_write(log_file_handle, "-" * 80 + "\n\n")
 
         # Load templates and styles
-        operation_start = time.time()
-        template_html = import_file("rocm_blogs.templates", "index.html")
-        css_content = import_file("rocm_blogs.static.css", "index.css")
-        banner_css_content = import_file("rocm_blogs.static.css", "banner-slider.css")
+        operation_start = time.perf_counter()
+        index_template = _load_index_template()
         track_operation_time("load_templates_and_styles", operation_start)
 
         if log_file_handle:
@@ -1143,13 +1427,8 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 log_file_handle, "Successfully loaded templates and styles\n"
             )
 
-        # Format the index template
-        index_template = INDEX_TEMPLATE.format(
-            CSS=css_content, BANNER_CSS=banner_css_content, HTML=template_html
-        )
-
         # Initialize ROCmBlogs instance if not provided
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         if rocm_blogs is None:
             rocm_blogs = ROCmBlogs()
             blogs_directory = rocm_blogs.find_blogs_directory(sphinx_app.srcdir)
@@ -1159,16 +1438,18 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         if not blogs_directory:
             error_message = "Could not find blogs directory"
             log_message("error", error_message, "general", "__init__")
-            log_message(
-                "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-            )
 
-            if log_file_handle:
-                safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
-                safe_log_write(
-                    log_file_handle, f"Traceback: {traceback.format_exc()}\n"
+            # Only format the traceback when something will record it
+            if log_file_handle or is_logging_enabled_from_config():
+                error_traceback = traceback.format_exc()
+                log_message(
+                    "debug", f"Traceback: {error_traceback}", "general", "__init__"
                 )
 
+                if log_file_handle:
+                    safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
+                    safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
+
             _CRITICAL_ERROR_OCCURRED = True
             raise ROCmBlogsError(error_message)
 
@@ -1180,16 +1461,28 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 log_file_handle, f"Found blogs directory: {blogs_directory}\n"
             )
 
-        operation_start = time.time()
-        readme_count = rocm_blogs.find_readme_files()
+        # A shared instance has already walked the tree and parsed every
+        # README; re-parsing would only be rejected as duplicates, so just
+        # refresh the file stats (the metadata step may have rewritten them)
+        reuse_scanned_blogs = bool(rocm_blogs.blog_paths) and bool(
+            rocm_blogs.blogs.blogs
+        )
+
+        operation_start = time.perf_counter()
+        if reuse_scanned_blogs:
+            rocm_blogs.refresh_readme_stats()
+        else:
+            rocm_blogs.find_readme_files()
+        readme_count = len(rocm_blogs.blog_paths)
         track_operation_time("find_readme_files", operation_start)
 
         if log_file_handle:
             safe_log_write(log_file_handle, f"Found {readme_count} README files\n")
 
-        operation_start = time.time()
-        rocm_blogs.create_blog_objects()
-        track_operation_time("create_blog_objects", operation_start)
+        if not reuse_scanned_blogs:
+            operation_start = time.perf_counter()
+            rocm_blogs.create_blog_objects()
+            track_operation_time("create_blog_objects", operation_start)
         
         # Report duplicate statistics
         duplicate_stats = rocm_blogs.blogs.get_duplicate_statistics()
@@ -1233,19 +1526,20 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                         f"  - {dup_type}: {description}\n"
                     )
 
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         rocm_blogs.blogs.write_to_file()
         track_operation_time("write_blogs_to_file", operation_start)
 
-        operation_start = time.time()
-        rocm_blogs.find_author_files()
-        track_operation_time("find_author_files", operation_start)
+        if not rocm_blogs.author_paths:
+            operation_start = time.perf_counter()
+            rocm_blogs.find_author_files()
+            track_operation_time("find_author_files", operation_start)
 
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         update_author_files(sphinx_app, rocm_blogs)
         track_operation_time("update_author_files", operation_start)
 
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         blog_statistics(sphinx_app, rocm_blogs)
         track_operation_time("blog_statistics", operation_start)
 
@@ -1261,6 +1555,39 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 log_file_handle, f"Wrote blog information to {blogs_csv_path}\n"
             )
 
+        # On incremental builds, skip the rest of the phase when none of the
+        # index page's inputs changed since the build that wrote it. The
+        # steps above still run; author pages have their own freshness check
+        index_inputs_digest = None
+        index_hash_path = Path(blogs_directory) / _INDEX_BUILD_HASH_FILE
+        if _incremental_build_enabled():
+            index_inputs_digest = _index_inputs_digest(
+                blogs_directory, rocm_blogs.blog_path_stats
+            )
+            try:
+                index_is_current = (Path(blogs_directory) / "index.md").exists() and (
+                    index_hash_path.read_text(encoding="utf-8") == index_inputs_digest
+                )
+            except OSError:
+                index_is_current = False
+
+            if index_is_current:
+                total_blogs_skipped += 1
+                phase_duration = time.perf_counter() - phase_start_time
+                _BUILD_PHASES[phase_name] = phase_duration
+                log_message(
+                    "info",
+                    "Index inputs are unchanged, skipping index update",
+                    "general",
+                    "__init__",
+                )
+                if log_file_handle:
+                    safe_log_write(
+                        log_file_handle,
+                        "Index inputs are unchanged, skipping index update\n",
+                    )
+                return
+
         features_csv_path = Path(blogs_directory) / "featured-blogs.csv"
         featured_blogs = []
 
@@ -1345,13 +1672,10 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, "Sorted blogs by date\n")
 
-        category_keys = [
-            category_info.get("category_key", category_info["name"])
-            for category_info in BLOG_CATEGORIES
-        ]
+        category_keys = BLOG_CATEGORY_KEYS
         log_message(
             "info",
-            "Using category keys for sorting: {category_keys}",
+            f"Using category keys for sorting: {category_keys}",
             "general",
             "__init__",
         )
@@ -1432,34 +1756,43 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, f"Retrieved {len(all_blogs)} total blogs\n")
 
-        # Filter blogs to only include real blog posts
+        # Filter blogs to only include real blog posts, bucketing them by
+        # category in the same pass for the category sections
         filtered_blogs = []
+        blogs_by_category = [[] for _ in GRID_CATEGORY_IDS]
         skipped_count = 0
+        # Per-blog log lines are only kept in verbose mode and are written in
+        # one call
+        verbose_log = log_file_handle and is_verbose_logging_enabled()
+        filter_log_lines = []
+        add_filtered_blog = filtered_blogs.append
 
         for blog in all_blogs:
-            if hasattr(blog, "blogpost") and blog.blogpost:
-                filtered_blogs.append(blog)
+            if blog.blogpost:
+                add_filtered_blog(blog)
+                if blog.category_id >= 0:
+                    blogs_by_category[blog.category_id].append(blog)
                 total_blogs_processed += 1
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Including blog: {getattr(blog, 'file_path', 'Unknown')}\n",
-                    )
+                if verbose_log:
+                    filter_log_lines.append(f"Including blog: {blog.file_path}\n")
             else:
+                # Blog objects always carry their file path
+                blog_path = blog.file_path
                 skipped_count += 1
                 total_blogs_skipped += 1
                 log_message(
                     "debug",
-                    f"Skipping non-blog README file for index page: {getattr(blog, 'file_path', 'Unknown')}",
+                    f"Skipping non-blog README file for index page: {blog_path}",
                     "general",
                     "__init__",
                 )
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Skipping non-blog README file: {getattr(blog, 'file_path', 'Unknown')}\n",
+                if verbose_log:
+                    filter_log_lines.append(
+                        f"Skipping non-blog README file: {blog_path}\n"
                     )
 
+        safe_log_write(log_file_handle, "".join(filter_log_lines))
+
         log_message(
             "info",
             f"Filtered out {skipped_count} non-blog README files for index page, kept {len(filtered_blogs)} genuine blog posts",
@@ -1651,6 +1984,14 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                     f"Featured titles already selected: {featured_titles}\n",
                 )
 
+                # Titles used elsewhere on the homepage, collected once; nothing
+                # else has been placed yet in the usual case, so this is empty
+                used_titles = {
+                    used_blog.blog_title
+                    for used_blog in used_blogs
+                    if hasattr(used_blog, "blog_title")
+                }
+
                 # Find blogs not already in featured and not used elsewhere
                 eligible_blogs = []
                 for blog in all_blogs:
@@ -1658,14 +1999,7 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                         hasattr(blog, "blog_title")
                         and blog.blog_title not in featured_titles
                     ):
-                        # Check if blog is used elsewhere on homepage by checking used_blogs list
-                        blog_used_elsewhere = any(
-                            hasattr(used_blog, "blog_title")
-                            and getattr(used_blog, "blog_title") == blog.blog_title
-                            for used_blog in used_blogs
-                        )
-
-                        if not blog_used_elsewhere:
+                        if blog.blog_title not in used_titles:
                             eligible_blogs.append(blog)
                         else:
                             log_message(
@@ -1919,26 +2253,21 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             )
 
         # Filter out used blogs from category lists (now includes Recent Posts)
+        (
+            ecosystem_category_blogs,
+            application_category_blogs,
+            software_category_blogs,
+        ) = blogs_by_category
         ecosystem_blogs = [
-            blog
-            for blog in all_blogs
-            if hasattr(blog, "category")
-            and blog.category == "Ecosystems and Partners"
-            and id(blog) not in used_blog_ids
+            blog for blog in ecosystem_category_blogs if id(blog) not in used_blog_ids
         ]
         application_blogs = [
             blog
-            for blog in all_blogs
-            if hasattr(blog, "category")
-            and blog.category == "Applications & models"
-            and id(blog) not in used_blog_ids
+            for blog in application_category_blogs
+            if id(blog) not in used_blog_ids
         ]
         software_blogs = [
-            blog
-            for blog in all_blogs
-            if hasattr(blog, "category")
-            and blog.category == "Software tools & optimizations"
-            and id(blog) not in used_blog_ids
+            blog for blog in software_category_blogs if id(blog) not in used_blog_ids
         ]
 
         if log_file_handle:
@@ -1947,15 +2276,15 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             )
             safe_log_write(
                 log_file_handle,
-                f"  - Ecosystems and Partners: {len(ecosystem_blogs)} blogs (excluded {len([b for b in all_blogs if hasattr(b, 'category') and b.category == 'Ecosystems and Partners']) - len(ecosystem_blogs)} duplicates)\n",
+                f"  - Ecosystems and Partners: {len(ecosystem_blogs)} blogs (excluded {len(ecosystem_category_blogs) - len(ecosystem_blogs)} duplicates)\n",
             )
             safe_log_write(
                 log_file_handle,
-                f"  - Applications & models: {len(application_blogs)} blogs (excluded {len([b for b in all_blogs if hasattr(b, 'category') and b.category == 'Applications & models']) - len(application_blogs)} duplicates)\n",
+                f"  - Applications & models: {len(application_blogs)} blogs (excluded {len(application_category_blogs) - len(application_blogs)} duplicates)\n",
             )
             safe_log_write(
                 log_file_handle,
-                f"  - Software tools & optimizations: {len(software_blogs)} blogs (excluded {len([b for b in all_blogs if hasattr(b, 'category') and b.category == 'Software tools & optimizations']) - len(software_blogs)} duplicates)\n",
+                f"  - Software tools & optimizations: {len(software_blogs)} blogs (excluded {len(software_category_blogs) - len(software_blogs)} duplicates)\n",
             )
 
         if log_file_handle:
@@ -2038,17 +2367,15 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, "Replacing placeholders in the template\n")
 
-        updated_html = (
-            index_template.replace("{grid_items}", "\n".join(main_grid_items))
-            .replace(
-                "{eco_grid_items}",
-                "\n".join(ecosystem_grid_items) if ecosystem_grid_items else "",
-            )
-            .replace("{application_grid_items}", "\n".join(application_grid_items))
-            .replace("{software_grid_items}", "\n".join(software_grid_items))
-            .replace("{featured_grid_items}", "\n".join(featured_grid_items))
-            .replace("{banner_slider}", banner_content)
-        )
+        # Newline-separated items that fill each placeholder
+        placeholder_items = {
+            "grid_items": main_grid_items,
+            "eco_grid_items": ecosystem_grid_items,
+            "application_grid_items": application_grid_items,
+            "software_grid_items": software_grid_items,
+            "featured_grid_items": featured_grid_items,
+            "banner_slider": [banner_content],
+        }
 
         # Write the updated HTML to blogs/index.md
         output_path = Path(blogs_directory) / "index.md"
@@ -2056,17 +2383,43 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         if log_file_handle:
             safe_log_write(log_file_handle, f"Writing updated HTML to {output_path}\n")
 
-        with output_path.open("w", encoding="utf-8") as output_file:
-            output_file.write(updated_html)
+        # Splitting on the placeholder pattern puts placeholder names at the
+        # odd indices. Join the page once and write it as bytes, like the
+        # paginated pages, rather than through a text-mode file.
+        index_html = "".join(
+            (
+                "\n".join(placeholder_items[template_part])
+                if part_index % 2
+                else template_part
+            )
+            for part_index, template_part in enumerate(
+                INDEX_PLACEHOLDER_PATTERN.split(index_template)
+            )
+        )
+        # Leave an identical index.md untouched so Sphinx does not reread it
+        if not write_file_if_changed(output_path, index_html.encode("utf-8")):
+            log_message(
+                "info",
+                f"{output_path} is unchanged, skipping write",
+                "general",
+                "__init__",
+            )
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle, f"{output_path} is unchanged, skipping write\n"
+                )
+
+        if index_inputs_digest is not None:
+            index_hash_path.write_text(index_inputs_digest, encoding="utf-8")
 
         total_blogs_successful += 1
 
         # Record timing information
-        phase_duration = time.time() - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
         _BUILD_PHASES[phase_name] = phase_duration
         log_message(
             "info",
-            "Successfully updated {output_path} with new content in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Successfully updated {output_path} with new content in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -2079,7 +2432,8 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
 
     except ROCmBlogsError:
         # Re-raise ROCmBlogsError to stop the build
-        _BUILD_PHASES[phase_name] = time.time() - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
+        _BUILD_PHASES[phase_name] = phase_duration
 
         if log_file_handle:
             safe_log_write(log_file_handle, f"ERROR: ROCmBlogsError occurred\n")
@@ -2089,22 +2443,26 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
     except Exception as error:
         error_message = f"Error updating index file: {error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
-        _BUILD_PHASES[phase_name] = time.time() - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
+        _BUILD_PHASES[phase_name] = phase_duration
         _CRITICAL_ERROR_OCCURRED = True
         raise ROCmBlogsError(error_message) from error
     finally:
+        # Reuse the duration recorded for the phase so the summary matches it
+        if phase_duration is None:
+            phase_duration = time.perf_counter() - phase_start_time
+
         # Write summary to log file
         if log_file_handle:
-            end_time = time.time()
-            total_duration = end_time - phase_start_time
 
             safe_log_write(log_file_handle, "\n" + "=" * 80 + "\n")
             safe_log_write(log_file_handle, "INDEX UPDATE SUMMARY\n")
@@ -2117,7 +2475,7 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             safe_log_write(log_file_handle, f"Warnings: {total_blogs_warning}\n")
             safe_log_write(log_file_handle, f"Skipped: {total_blogs_skipped}\n")
             safe_log_write(
-                log_file_handle, f"Total time: {total_duration:.2f} seconds\n"
+                log_file_handle, f"Total time: {phase_duration:.2f} seconds\n"
             )
 
             if all_error_details:
@@ -2125,10 +2483,10 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 safe_log_write(log_file_handle, "-" * 80 + "\n")
                 for index, error_detail in enumerate(all_error_details):
                     safe_log_write(
-                        log_file_handle, f"{index+1}. Blog: {error_detail['blog']}\n"
+                        log_file_handle, f"{index+1}. Blog: {error_detail.name}\n"
                     )
                     safe_log_write(
-                        log_file_handle, f"   Error: {error_detail['error']}\n\n"
+                        log_file_handle, f"   Error: {error_detail.error}\n\n"
                     )
 
             safe_log_close(log_file_handle)
@@ -2138,8 +2496,9 @@ def update_index_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
 def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
     """Generate blog pages with styling and metadata - OPTIMIZED VERSION."""
     global _CRITICAL_ERROR_OCCURRED
-    phase_start_time = time.time()
+    phase_start_time = time.perf_counter()
     phase_name = "blog_generation"
+    phase_duration = None
 
     # Create a log file for this step
     log_filepath, log_file_handle = create_step_log_file(phase_name)
@@ -2201,10 +2560,13 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
         seen_titles = set()
         blog_list = []
         dedup_lock = threading.Lock()
+        # Every added blog is only logged in verbose mode, in a single write
+        verbose_log = log_file_handle and is_verbose_logging_enabled()
+        added_blog_log_lines = []
 
         for blog in all_blogs:
-            if hasattr(blog, "blogpost") and blog.blogpost:
-                blog_path = getattr(blog, "file_path", None)
+            if blog.blogpost:
+                blog_path = blog.file_path
                 blog_title = getattr(blog, "blog_title", None)
 
                 with dedup_lock:
@@ -2231,12 +2593,13 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                         if blog_title:
                             seen_titles.add(blog_title)
                         blog_list.append(blog)
-                        if log_file_handle:
-                            safe_log_write(
-                                log_file_handle,
-                                f"ADDED UNIQUE BLOG: {blog_title} (path: {blog_path})\n",
+                        if verbose_log:
+                            added_blog_log_lines.append(
+                                f"ADDED UNIQUE BLOG: {blog_title} (path: {blog_path})\n"
                             )
 
+        safe_log_write(log_file_handle, "".join(added_blog_log_lines))
+
         total_blogs = len(blog_list)
         total_duplicates_removed = len(all_blogs) - total_blogs
 
@@ -2258,12 +2621,17 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             total_blogs_warning += 1
             return
 
+        # process_single_blog updates the shared blog objects and spends most
+        # of its time in file I/O and Pillow, both of which release the GIL,
+        # so threads are kept. Never start more workers than there are blogs.
+        cpu_count = os.cpu_count() or 1
         if total_blogs < 10:
-            max_workers = min(4, os.cpu_count())
+            max_workers = min(4, cpu_count)
         elif total_blogs < 50:
-            max_workers = min(8, os.cpu_count())
+            max_workers = min(8, cpu_count)
         else:
-            max_workers = os.cpu_count()
+            max_workers = cpu_count
+        max_workers = min(max_workers, total_blogs)
 
         log_message(
             "info",
@@ -2277,58 +2645,71 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 log_file_handle,
                 f"Using optimized thread pool: {max_workers} workers for {total_blogs} blogs\n",
             )
+            # Blog processing is the longest step; get the setup log onto disk first
+            safe_log_flush(log_file_handle)
 
-        processing_start = time.time()
+        processing_start = time.perf_counter()
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_blog = {
-                executor.submit(process_single_blog, blog, rocm_blogs): (i, blog)
-                for i, blog in enumerate(blog_list)
-            }
+            # Keep a bounded window of blogs in flight and handle each one as it
+            # finishes, so finished futures and their results are released early
+            max_pending = max_workers * 2
+            pending_futures = {}
+            blogs_to_submit = enumerate(blog_list)
 
             if log_file_handle:
                 safe_log_write(
                     log_file_handle,
-                    f"Submitted {len(future_to_blog)} blog processing tasks\n",
+                    f"Submitting {total_blogs} blog processing tasks, at most {max_pending} at a time\n",
                 )
 
             completed_count = 0
-            for future in as_completed(future_to_blog):
-                blog_index, blog = future_to_blog[future]
-                completed_count += 1
-                total_blogs_processed += 1
+            while True:
+                for blog_index, blog in itertools.islice(
+                    blogs_to_submit, max_pending - len(pending_futures)
+                ):
+                    pending_futures[
+                        executor.submit(process_single_blog, blog, rocm_blogs)
+                    ] = (blog_index, blog)
+
+                if not pending_futures:
+                    break
+
+                done_futures, _ = wait(pending_futures, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    blog_index, blog = pending_futures.pop(future)
+                    completed_count += 1
+                    total_blogs_processed += 1
 
-                try:
-                    future.result()  # This will raise any exceptions from the thread
-                    total_blogs_successful += 1
+                    try:
+                        future.result()  # This will raise any exceptions from the thread
+                        total_blogs_successful += 1
 
-                    if log_file_handle and (
-                        completed_count % 10 == 0 or completed_count == total_blogs
-                    ):
-                        safe_log_write(
-                            log_file_handle,
-                            f"Progress: {completed_count}/{total_blogs} blogs processed ({(completed_count/total_blogs)*100:.1f}%)\n",
-                        )
+                        if log_file_handle and (
+                            completed_count % 10 == 0 or completed_count == total_blogs
+                        ):
+                            safe_log_write(
+                                log_file_handle,
+                                f"Progress: {completed_count}/{total_blogs} blogs processed ({(completed_count/total_blogs)*100:.1f}%)\n",
+                            )
+
+                    except Exception as processing_error:
+                        blog_path = blog.file_path
+                        error_message = f"Error processing blog: {processing_error}"
+                        log_message("warning", error_message, "general", "__init__")
 
-                except Exception as processing_error:
-                    error_message = f"Error processing blog: {processing_error}"
-                    log_message("warning", error_message, "general", "__init__")
+                        if log_file_handle:
+                            safe_log_write(
+                                log_file_handle,
+                                f"ERROR: Blog {blog_index + 1}/{total_blogs}: {blog_path} - {processing_error}\n",
+                            )
 
-                    if log_file_handle:
-                        safe_log_write(
-                            log_file_handle,
-                            f"ERROR: Blog {blog_index + 1}/{total_blogs}: {getattr(blog, 'file_path', 'Unknown')} - {processing_error}\n",
+                        total_blogs_error += 1
+                        all_error_details.append(
+                            _ErrorDetail(blog_path, str(processing_error))
                         )
 
-                    total_blogs_error += 1
-                    all_error_details.append(
-                        {
-                            "blog": getattr(blog, "file_path", "Unknown"),
-                            "error": str(processing_error),
-                        }
-                    )
-
-        processing_duration = time.time() - processing_start
+        processing_duration = time.perf_counter() - processing_start
 
         if log_file_handle:
             safe_log_write(
@@ -2337,8 +2718,7 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             )
 
         # Log completion statistics
-        phase_end_time = time.time()
-        phase_duration = phase_end_time - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
         _BUILD_PHASES["blog_generation"] = phase_duration
 
         error_threshold = total_blogs * 0.5  # Increased from 0.25 to 0.5
@@ -2375,7 +2755,8 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             )
 
     except ROCmBlogsError:
-        _BUILD_PHASES["blog_generation"] = time.time() - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
+        _BUILD_PHASES["blog_generation"] = phase_duration
 
         if log_file_handle:
             safe_log_write(log_file_handle, f"ERROR: ROCmBlogsError occurred\n")
@@ -2385,22 +2766,26 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
     except Exception as generation_error:
         error_message = f"Error generating blog pages: {generation_error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
-        _BUILD_PHASES["blog_generation"] = time.time() - phase_start_time
+        phase_duration = time.perf_counter() - phase_start_time
+        _BUILD_PHASES["blog_generation"] = phase_duration
         _CRITICAL_ERROR_OCCURRED = True
         raise ROCmBlogsError(error_message) from generation_error
     finally:
+        # Reuse the duration recorded for the phase so the summary matches it
+        if phase_duration is None:
+            phase_duration = time.perf_counter() - phase_start_time
+
         # Write summary to log file
         if log_file_handle:
-            end_time = time.time()
-            total_duration = end_time - phase_start_time
 
             safe_log_write(log_file_handle, "\n" + "=" * 80 + "\n")
             safe_log_write(log_file_handle, "BLOG GENERATION SUMMARY\n")
@@ -2413,7 +2798,7 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
             safe_log_write(log_file_handle, f"Warnings: {total_blogs_warning}\n")
             safe_log_write(log_file_handle, f"Skipped: {total_blogs_skipped}\n")
             safe_log_write(
-                log_file_handle, f"Total time: {total_duration:.2f} seconds\n"
+                log_file_handle, f"Total time: {phase_duration:.2f} seconds\n"
             )
 
             if all_error_details:
@@ -2421,19 +2806,27 @@ def blog_generation(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs = None) -> None:
                 safe_log_write(log_file_handle, "-" * 80 + "\n")
                 for index, error_detail in enumerate(all_error_details):
                     safe_log_write(
-                        log_file_handle, f"{index+1}. Blog: {error_detail['blog']}\n"
+                        log_file_handle, f"{index+1}. Blog: {error_detail.name}\n"
                     )
                     safe_log_write(
-                        log_file_handle, f"   Error: {error_detail['error']}\n\n"
+                        log_file_handle, f"   Error: {error_detail.error}\n\n"
                     )
 
             safe_log_close(log_file_handle)
 
 
+def _render_banner_item(rocmblogs, blog, index):
+    """Render a blog's banner slide and navigation item."""
+    return (
+        generate_banner_slide(blog, rocmblogs, index, index == 0),
+        generate_banner_navigation_item(blog, index, index == 0),
+    )
+
+
 def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
     """Generate banner slider content for the index page."""
     try:
-        banner_start_time = time.time()
+        banner_start_time = time.perf_counter()
         log_message(
             "info",
             "========== BANNER SLIDER GENERATION STARTED ==========",
@@ -2457,7 +2850,7 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
         for i, blog in enumerate(banner_blogs):
             blog_title = getattr(blog, "blog_title", "No Title")
             blog_path = getattr(blog, "file_path", "No Path")
-            blog_category = getattr(blog, "category", "No Category")
+            blog_category = blog.category or "No Category"
             has_thumbnail = hasattr(blog, "thumbnail")
             has_image_paths = hasattr(blog, "image_paths") and blog.image_paths
 
@@ -2507,6 +2900,15 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
         # Track successful generations per index to maintain alignment
         successful_indices = []
 
+        # Render the slides concurrently; results are checked below in order
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(banner_blogs), os.cpu_count() or 1))
+        ) as executor:
+            banner_futures = [
+                executor.submit(_render_banner_item, rocmblogs, blog, i)
+                for i, blog in enumerate(banner_blogs)
+            ]
+
         for i, blog in enumerate(banner_blogs):
             blog_title = getattr(blog, "blog_title", "Unknown")
             log_message(
@@ -2526,7 +2928,7 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                     "banner_slider",
                     "__init__",
                 )
-                slide_html = generate_banner_slide(blog, rocmblogs, i, i == 0)
+                slide_html, nav_html = banner_futures[i].result()
                 log_message(
                     "info",
                     f"Step 1 Result: slide_html type={type(slide_html)}, length={len(slide_html) if slide_html else 0}",
@@ -2554,7 +2956,6 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                     "banner_slider",
                     "__init__",
                 )
-                nav_html = generate_banner_navigation_item(blog, i, i == 0)
                 log_message(
                     "info",
                     f"Step 2 Result: nav_html type={type(nav_html)}, length={len(nav_html) if nav_html else 0}",
@@ -2670,12 +3071,13 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                     "banner_slider",
                     "__init__",
                 )
-                log_message(
-                    "error",
-                    f"Traceback: {traceback.format_exc()}",
-                    "banner_slider",
-                    "__init__",
-                )
+                if is_logging_enabled_from_config():
+                    log_message(
+                        "error",
+                        f"Traceback: {traceback.format_exc()}",
+                        "banner_slider",
+                        "__init__",
+                    )
 
                 # Log which step failed
                 # Clear any partial results to prevent misalignment
@@ -2749,12 +3151,13 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                 "banner_slider",
                 "__init__",
             )
-            log_message(
-                "debug",
-                f"Traceback: {traceback.format_exc()}",
-                "banner_slider",
-                "__init__",
-            )
+            if is_logging_enabled_from_config():
+                log_message(
+                    "debug",
+                    f"Traceback: {traceback.format_exc()}",
+                    "banner_slider",
+                    "__init__",
+                )
             raise ROCmBlogsError("No banner slides were generated")
         elif len(banner_slides) != len(banner_blogs):
             log_message(
@@ -2789,9 +3192,13 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                 "general",
                 "__init__",
             )
-            log_message(
-                "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-            )
+            if is_logging_enabled_from_config():
+                log_message(
+                    "debug",
+                    f"Traceback: {traceback.format_exc()}",
+                    "general",
+                    "__init__",
+                )
             return ""
 
         # Fill in the banner slider template
@@ -2921,7 +3328,7 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
 ```
 """
 
-        banner_elapsed_time = time.time() - banner_start_time
+        banner_elapsed_time = time.perf_counter() - banner_start_time
 
         if error_count > 0:
             log_message(
@@ -2930,9 +3337,13 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
                 "general",
                 "__init__",
             )
-            log_message(
-                "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-            )
+            if is_logging_enabled_from_config():
+                log_message(
+                    "debug",
+                    f"Traceback: {traceback.format_exc()}",
+                    "general",
+                    "__init__",
+                )
         else:
             log_message(
                 "info",
@@ -2943,7 +3354,7 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
 
         log_message(
             "info",
-            "Banner slider generation completed in \033[96m{banner_elapsed_time:.4f} seconds\033[0m",
+            f"Banner slider generation completed in \033[96m{banner_elapsed_time:.4f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -2955,9 +3366,10 @@ def _generate_banner_slider(rocmblogs, banner_blogs, used_blogs):
         log_message(
             "error", f"Error generating banner slider: {error}", "general", "__init__"
         )
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        if is_logging_enabled_from_config():
+            log_message(
+                "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
+            )
         return ""
 
 
@@ -3024,7 +3436,7 @@ def run_metadata_generator(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         _BUILD_PHASES[phase_name] = phase_duration
         log_message(
             "info",
-            "Metadata generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Metadata generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -3047,13 +3459,14 @@ def run_metadata_generator(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
     except Exception as metadata_error:
         error_message = f"Failed to generate metadata: {metadata_error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
         _BUILD_PHASES[phase_name] = time.time() - phase_start_time
         _CRITICAL_ERROR_OCCURRED = True
@@ -3111,8 +3524,8 @@ def process_templates_for_vertical(
         "has_software_blogs": bool(software_grid_items),
     }
 
-    # Create a Jinja2 template from the template string
-    jinja_template = Template(template_string)
+    # Every vertical renders the same template, so it is compiled only once
+    jinja_template = _compile_vertical_template(template_string)
 
     # Render the template with the context
     return jinja_template.render(**context)
@@ -3144,17 +3557,6 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             safe_log_write(log_file_handle, "Starting posts file generation process\n")
             safe_log_write(log_file_handle, "-" * 80 + "\n\n")
 
-        # Load templates and styles
-        template_html = import_file("rocm_blogs.templates", "posts.html")
-        pagination_template = import_file("rocm_blogs.templates", "pagination.html")
-        css_content = import_file("rocm_blogs.static.css", "index.css")
-        pagination_css = import_file("rocm_blogs.static.css", "pagination.css")
-
-        if log_file_handle:
-            safe_log_write(
-                log_file_handle, "Successfully loaded templates and styles\n"
-            )
-
         # Use the shared ROCmBlogs instance
         blogs_directory = rocm_blogs.blogs_directory
 
@@ -3172,7 +3574,7 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         filtered_blogs = []
         skipped_count = 0
         for blog in all_blogs:
-            if hasattr(blog, "blogpost") and blog.blogpost:
+            if blog.blogpost:
                 filtered_blogs.append(blog)
                 total_blogs_processed += 1
 
@@ -3210,11 +3612,7 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 f"Filtered out {skipped_count} non-blog README files, kept {len(filtered_blogs)} genuine blog posts\n",
             )
 
-        sorted_blogs = sorted(
-            filtered_blogs,
-            key=lambda blog: getattr(blog, "date", datetime.now()),
-            reverse=True,
-        )
+        sorted_blogs = _sort_blogs_newest_first(filtered_blogs)
 
         if log_file_handle:
             safe_log_write(log_file_handle, "Sorted blogs by date (newest first)\n")
@@ -3226,7 +3624,7 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
 
         log_message(
             "info",
-            "Generating {total_pages} paginated posts pages with {BLOGS_PER_PAGE} blogs per page",
+            f"Generating {total_pages} paginated posts pages with {BLOGS_PER_PAGE} blogs per page",
             "general",
             "__init__",
         )
@@ -3260,113 +3658,104 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 log_file_handle, f"Generated {len(all_grid_items)} grid items\n"
             )
 
+        # Load templates and styles only once there are pages to write
+        template_html = import_file("rocm_blogs.templates", "posts.html")
+        pagination_template, css_content, pagination_css = _load_pagination_assets()
+
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle, "Successfully loaded templates and styles\n"
+            )
+
         # Current datetime for template
-        current_datetime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        current_datetime = current_timestamp()
+        dated_template_html = template_html.replace("{datetime}", current_datetime)
+        posts_page_template = _compile_page_template(
+            POSTS_TEMPLATE, CSS=css_content, PAGINATION_CSS=pagination_css
+        )
 
         # Generate each page
         if log_file_handle:
             safe_log_write(log_file_handle, "Generating individual pages\n")
 
-        for page_num in range(1, total_pages + 1):
-            # Get grid items for this page
-            start_index = (page_num - 1) * BLOGS_PER_PAGE
-            end_index = min(start_index + BLOGS_PER_PAGE, len(all_grid_items))
-            page_grid_items = all_grid_items[start_index:end_index]
-            grid_content = "\n".join(page_grid_items)
-
-            if log_file_handle:
-                safe_log_write(
-                    log_file_handle,
-                    f"Processing page {page_num}/{total_pages} with {len(page_grid_items)} grid items\n",
-                )
-
-            # Create pagination controls
-            pagination_controls = _create_pagination_controls(
-                pagination_template, page_num, total_pages, "posts"
-            )
-
-            # Add page suffix for pages after the first
-            page_title_suffix = f" - Page {page_num}" if page_num > 1 else ""
-            page_description_suffix = (
-                f" (Page {page_num} of {total_pages})" if page_num > 1 else ""
-            )
+        # Paginate the generated grid items so that every page has content;
+        # each page's items are sliced and joined only when it is built
+        total_pages = (len(all_grid_items) + BLOGS_PER_PAGE - 1) // BLOGS_PER_PAGE
 
-            # Validate grid content before creating page
-            if not page_grid_items:
-                log_message(
-                    "warning",
-                    f"No grid items for page {page_num}/{total_pages}. Skipping page creation.",
-                    "general",
-                    "__init__",
-                )
+        def build_page_jobs():
+            for page_num, page_grid_items in enumerate(
+                _iter_page_grid_items(all_grid_items, BLOGS_PER_PAGE), start=1
+            ):
                 if log_file_handle:
                     safe_log_write(
                         log_file_handle,
-                        f"WARNING: No grid items for page {page_num}/{total_pages}. Skipping page creation.\n",
+                        f"Processing page {page_num}/{total_pages} with {len(page_grid_items)} grid items\n",
                     )
-                continue
 
-            # Additional validation: ensure grid content is meaningful
-            if not grid_content or not grid_content.strip():
-                log_message(
-                    "warning",
-                    f"Empty or whitespace-only grid content for page {page_num}/{total_pages}. Skipping page creation.",
-                    "general",
-                    "__init__",
+                # Create pagination controls
+                pagination_controls = _create_pagination_controls(
+                    pagination_template, page_num, total_pages, "posts"
                 )
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"WARNING: Empty grid content for page {page_num}/{total_pages}. Skipping page creation.\n",
-                    )
-                continue
 
-            # Create the final page content
-            page_content = POSTS_TEMPLATE.format(
-                CSS=css_content,
-                PAGINATION_CSS=pagination_css,
-                HTML=template_html.replace("{grid_items}", grid_content).replace(
-                    "{datetime}", current_datetime
-                ),
-                pagination_controls=pagination_controls,
-                page_title_suffix=page_title_suffix,
-                page_description_suffix=page_description_suffix,
-                current_page=page_num,
-            )
+                # Add page suffix for pages after the first
+                page_title_suffix = f" - Page {page_num}" if page_num > 1 else ""
+                page_description_suffix = (
+                    f" (Page {page_num} of {total_pages})" if page_num > 1 else ""
+                )
 
-            # Final validation: ensure page content is not empty
-            if not page_content or len(page_content.strip()) < 100:
-                log_message(
-                    "warning",
-                    f"Generated page content is too small or empty for page {page_num}/{total_pages}. Skipping file creation.",
-                    "general",
-                    "__init__",
+                # Fill in the page body; the rest is streamed from the template
+                page_html = dated_template_html.replace(
+                    "{grid_items}", "\n".join(page_grid_items)
                 )
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"WARNING: Page content too small for page {page_num}/{total_pages}. Skipping file creation.\n",
-                    )
-                continue
 
-            # Determine output filename and write the file
-            output_filename = (
-                "posts.md" if page_num == 1 else f"posts-page{page_num}.md"
-            )
-            output_path = Path(blogs_directory) / output_filename
+                # Final validation: ensure page content is not empty
+                if len(page_html.strip()) < 100:
+                    log_message(
+                        "warning",
+                        f"Generated page content is too small or empty for page {page_num}/{total_pages}. Skipping file creation.",
+                        "general",
+                        "__init__",
+                    )
+                    if log_file_handle:
+                        safe_log_write(
+                            log_file_handle,
+                            f"WARNING: Page content too small for page {page_num}/{total_pages}. Skipping file creation.\n",
+                        )
+                    continue
 
-            if log_file_handle:
-                safe_log_write(log_file_handle, f"Writing page to {output_path}\n")
+                # Determine output filename and write the file
+                output_filename = (
+                    "posts.md" if page_num == 1 else f"posts-page{page_num}.md"
+                )
+                output_path = Path(blogs_directory) / output_filename
 
-            with output_path.open("w", encoding="utf-8") as output_file:
-                output_file.write(page_content)
+                if log_file_handle:
+                    safe_log_write(log_file_handle, f"Writing page to {output_path}\n")
+
+                yield (
+                    (page_num, len(page_grid_items)),
+                    output_path,
+                    posts_page_template,
+                    {
+                        "HTML": page_html,
+                        "pagination_controls": pagination_controls,
+                        "page_title_suffix": page_title_suffix,
+                        "page_description_suffix": page_description_suffix,
+                        "current_page": page_num,
+                    },
+                )
 
+        # Each page is written while the next ones are built, so only the
+        # pages waiting on a write hold their HTML
+        for (page_num, page_item_count), output_path in _write_page_files(
+            build_page_jobs()
+        ):
             total_pages_created += 1
-            total_blogs_successful += len(page_grid_items)
+            total_blogs_successful += page_item_count
 
             log_message(
                 "info",
-                f"Created {output_path} with {len(page_grid_items)} grid items (page {page_num}/{total_pages})",
+                f"Created {output_path} with {page_item_count} grid items (page {page_num}/{total_pages})",
                 "general",
                 "__init__",
             )
@@ -3376,7 +3765,7 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         _BUILD_PHASES["update_posts"] = phase_duration
         log_message(
             "info",
-            "Successfully created {total_pages} paginated posts pages in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Successfully created {total_pages} paginated posts pages in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -3390,13 +3779,15 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
     except Exception as page_error:
         error_message = f"Failed to create posts files: {page_error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
+
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
         _BUILD_PHASES["update_posts"] = time.time() - phase_start_time
         _CRITICAL_ERROR_OCCURRED = True
@@ -3431,10 +3822,10 @@ def update_posts_file(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 safe_log_write(log_file_handle, "-" * 80 + "\n")
                 for index, error_detail in enumerate(all_error_details):
                     safe_log_write(
-                        log_file_handle, f"{index+1}. Blog: {error_detail['blog']}\n"
+                        log_file_handle, f"{index+1}. Blog: {error_detail.name}\n"
                     )
                     safe_log_write(
-                        log_file_handle, f"   Error: {error_detail['error']}\n\n"
+                        log_file_handle, f"   Error: {error_detail.error}\n\n"
                     )
 
             safe_log_close(log_file_handle)
@@ -3444,18 +3835,69 @@ def clean_html(html_content):
     """Clean HTML content by removing orphaned grid attributes and empty sections"""
 
     # Remove any standalone ":margin 2" lines that might be orphaned
-    html_content = re.sub(r"\n:margin 2\n", "\n", html_content)
+    html_content = ORPHANED_MARGIN_PATTERN.sub("\n", html_content)
 
     # Remove any malformed or empty grid sections completely
     # This pattern matches grid sections with no content between the tags
-    html_content = re.sub(r"::::{grid}[^\n]*\n:margin 2\n\n::::", "", html_content)
+    html_content = EMPTY_GRID_PATTERN.sub("", html_content)
 
     # Fix stacked colons in grid tags (like ::::::::{grid})
-    html_content = re.sub(r":+{grid}", "::::{grid}", html_content)
+    html_content = STACKED_GRID_COLONS_PATTERN.sub("::::{grid}", html_content)
 
     return html_content
 
 
+def _strip_invalid_slug_chars(slug):
+    """Drop every character outside [a-z0-9-] from an already lowercased slug."""
+    return (
+        slug.encode("ascii", "ignore")
+        .decode("ascii")
+        .translate(SLUG_INVALID_CHARS_TABLE)
+    )
+
+
+def _slugify(name):
+    """Convert a vertical or category name into the slug used in page filenames."""
+    slug = name.replace(" ", "-").replace("&", "and").lower()
+    return REPEATED_DASHES_PATTERN.sub("-", _strip_invalid_slug_chars(slug))
+
+
+@functools.lru_cache(maxsize=None)
+def _titleize(name):
+    """Convert a vertical or category name into the form shown in page titles."""
+    if name.lower() in ("ai", "hpc"):
+        title = name.upper()
+    else:
+        title = " ".join(word.capitalize() for word in name.split(" "))
+    return AND_WORD_PATTERN.sub("&", title)
+
+
+@functools.lru_cache(maxsize=None)
+def _category_page_title(title):
+    """Normalize a BLOG_CATEGORIES title into the form shown on its page."""
+    return AND_WORD_PATTERN.sub("&", title.capitalize())
+
+
+def _get_blog_verticals(blog):
+    """Return the market verticals a blog belongs to, falling back to its myst metadata."""
+    if blog.vertical:
+        if isinstance(blog.vertical, str):
+            return [v.strip() for v in blog.vertical.split(",") if v.strip()]
+        return blog.vertical
+
+    if hasattr(blog, "metadata") and blog.metadata:
+        try:
+            myst_data = blog.metadata.get("myst", {})
+            html_meta = myst_data.get("html_meta", {})
+            vertical_str = html_meta.get("vertical", "")
+
+            return [v.strip() for v in vertical_str.split(",") if v.strip()]
+        except (AttributeError, KeyError):
+            pass
+
+    return []
+
+
 @profile_function("update_vertical_pages", save_report=True)
 def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
     """Generate paginated vertical pages with improved conditional string replacement"""
@@ -3464,11 +3906,30 @@ def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
 
     log_filepath, log_file_handle = create_step_log_file(phase_name)
 
+    # Slugify each vertical name once for both the paginated and individual pages
+    verticals = rocm_blogs.blogs.blogs_verticals
+    vertical_slugs = {vertical: _slugify(vertical) for vertical in verticals}
+
+    if not verticals:
+        _BUILD_PHASES["update_vertical_pages"] = time.time() - phase_start_time
+        log_message(
+            "info",
+            "No verticals found, skipping vertical pages generation",
+            "general",
+            "__init__",
+        )
+
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle,
+                "No verticals found, skipping vertical pages generation\n",
+            )
+            safe_log_close(log_file_handle)
+        return
+
     # Import the raw HTML template
     template_html = import_file("rocm_blogs.templates", "vertical.html")
-    css_content = import_file("rocm_blogs.static.css", "index.css")
-    pagination_template = import_file("rocm_blogs.templates", "pagination.html")
-    pagination_css = import_file("rocm_blogs.static.css", "pagination.css")
+    pagination_template, css_content, pagination_css = _load_pagination_assets()
 
     # Create the full template with CSS
     index_template = VERTICAL_TEMPLATE.format(CSS=css_content, HTML=template_html)
@@ -3495,243 +3956,186 @@ def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         posts_template_html = import_file("rocm_blogs.templates", "posts.html")
 
         all_blogs = rocm_blogs.blogs.get_blogs()
-        filtered_blogs = [
-            blog for blog in all_blogs if hasattr(blog, "blogpost") and blog.blogpost
-        ]
-
-        sorted_blogs = sorted(
-            filtered_blogs,
-            key=lambda blog: getattr(blog, "date", datetime.now()),
-            reverse=True,
+        sorted_blogs = _sort_blogs_newest_first(
+            blog for blog in all_blogs if blog.blogpost
         )
 
-        verticals = rocm_blogs.blogs.blogs_verticals
-        for vertical in verticals:
-            vertical_blogs = []
-            for blog in sorted_blogs:
-                if hasattr(blog, "vertical") and blog.vertical:
-                    if isinstance(blog.vertical, str):
-                        blog_verticals = [
-                            v.strip() for v in blog.vertical.split(",") if v.strip()
-                        ]
-                    else:
-                        blog_verticals = blog.vertical
-
-                    if vertical in blog_verticals:
-                        vertical_blogs.append(blog)
-                elif hasattr(blog, "metadata") and blog.metadata:
-                    try:
-                        myst_data = blog.metadata.get("myst", {})
-                        html_meta = myst_data.get("html_meta", {})
-                        vertical_str = html_meta.get("vertical", "")
-
-                        blog_verticals = [
-                            v.strip() for v in vertical_str.split(",") if v.strip()
-                        ]
-                        if blog_verticals and vertical in blog_verticals:
-                            vertical_blogs.append(blog)
-                    except (AttributeError, KeyError) as e:
-                        pass
-
-            if not vertical_blogs:
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle, f"No blogs found for vertical: {vertical}\n"
-                    )
-                continue
-
-            BLOGS_PER_PAGE = POST_BLOGS_PER_PAGE
-            total_blogs = len(vertical_blogs)
-            total_pages = max(1, (total_blogs + BLOGS_PER_PAGE - 1) // BLOGS_PER_PAGE)
-
-            all_grid_items = _generate_lazy_loaded_grid_items(
-                rocm_blogs, vertical_blogs
-            )
-
-            # Check if any grid items were generated for this vertical
-            if not all_grid_items:
-                log_message(
-                    "warning",
-                    f"No grid items were generated for vertical: {vertical}. Skipping page generation.",
-                    "general",
-                    "__init__",
-                )
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"WARNING: No grid items for vertical: {vertical}. Skipping page generation.\n",
-                    )
-                continue
-
-            current_datetime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-
-            formatted_vertical = vertical.replace(" ", "-").replace("&", "and").lower()
-            formatted_vertical = re.sub(r"[^a-z0-9-]", "", formatted_vertical)
-            formatted_vertical = re.sub(r"-+", "-", formatted_vertical)
-
-            for page_num in range(1, total_pages + 1):
-                start_index = (page_num - 1) * BLOGS_PER_PAGE
-                end_index = min(start_index + BLOGS_PER_PAGE, len(all_grid_items))
-                page_grid_items = all_grid_items[start_index:end_index]
+        # Index the sorted blogs by vertical in a single pass
+        vertical_index = defaultdict(list)
+        for blog in sorted_blogs:
+            for blog_vertical in dict.fromkeys(_get_blog_verticals(blog)):
+                vertical_index[blog_vertical].append(blog)
 
-                # Validate grid content before creating page
-                if not page_grid_items:
-                    log_message(
-                        "warning",
-                        f"No grid items for vertical {vertical} page {page_num}/{total_pages}. Skipping page creation.",
-                        "general",
-                        "__init__",
-                    )
-                    if log_file_handle:
-                        safe_log_write(
-                            log_file_handle,
-                            f"WARNING: No grid items for vertical {vertical} page {page_num}/{total_pages}. Skipping page creation.\n",
-                        )
-                    continue
-
-                grid_content = "\n".join(page_grid_items)
-
-                # Additional validation: ensure grid content is meaningful
-                if not grid_content or not grid_content.strip():
-                    log_message(
-                        "warning",
-                        f"Empty grid content for vertical {vertical} page {page_num}/{total_pages}. Skipping page creation.",
-                        "general",
-                        "__init__",
-                    )
-                    if log_file_handle:
-                        safe_log_write(
-                            log_file_handle,
-                            f"WARNING: Empty grid content for vertical {vertical} page {page_num}/{total_pages}. Skipping page creation.\n",
-                        )
-                    continue
-
-                pagination_controls = _create_pagination_controls(
-                    pagination_template,
-                    page_num,
-                    total_pages,
-                    f"verticals-{formatted_vertical}",
-                )
-
-                # Add page suffix for pages after the first
-                page_title_suffix = f" - Page {page_num}" if page_num > 1 else ""
-                page_description_suffix = (
-                    f" (Page {page_num} of {total_pages})" if page_num > 1 else ""
-                )
+        current_datetime = current_timestamp()
+        dated_posts_template_html = posts_template_html.replace(
+            "{datetime}", current_datetime
+        )
 
-                # Create the final page content
-                page_content = POSTS_TEMPLATE.format(
-                    CSS=css_content,
-                    PAGINATION_CSS=pagination_css,
-                    HTML=posts_template_html.replace(
-                        "{grid_items}", grid_content
-                    ).replace("{datetime}", current_datetime),
-                    pagination_controls=pagination_controls,
-                    page_title_suffix=page_title_suffix,
-                    page_description_suffix=page_description_suffix,
-                    current_page=page_num,
-                )
+        def build_vertical_page_jobs():
+            for vertical in verticals:
+                vertical_blogs = vertical_index.get(vertical, [])
+
+                if not vertical_blogs:
+                    if log_file_handle:
+                        safe_log_write(
+                            log_file_handle,
+                            f"No blogs found for vertical: {vertical}\n",
+                        )
+                    continue
+
+                BLOGS_PER_PAGE = POST_BLOGS_PER_PAGE
 
-                # Replace the title to include the vertical name
-                page_content = page_content.replace(
-                    "# Recent Posts", f"# {vertical} Blogs"
+                all_grid_items = _generate_lazy_loaded_grid_items(
+                    rocm_blogs, vertical_blogs
                 )
 
-                # Final validation: ensure page content is not empty
-                if not page_content or len(page_content.strip()) < 100:
+                # Check if any grid items were generated for this vertical
+                if not all_grid_items:
                     log_message(
                         "warning",
-                        f"Generated page content is too small or empty for vertical {vertical} page {page_num}/{total_pages}. Skipping file creation.",
+                        f"No grid items were generated for vertical: {vertical}. Skipping page generation.",
                         "general",
                         "__init__",
                     )
                     if log_file_handle:
                         safe_log_write(
                             log_file_handle,
-                            f"WARNING: Page content too small for vertical {vertical} page {page_num}/{total_pages}. Skipping file creation.\n",
+                            f"WARNING: No grid items for vertical: {vertical}. Skipping page generation.\n",
                         )
                     continue
 
-                # Determine output filename and write the file
-                output_filename = (
-                    f"verticals-{formatted_vertical}.md"
-                    if page_num == 1
-                    else f"verticals-{formatted_vertical}-page{page_num}.md"
+                # Title the page after the vertical instead of "Recent Posts"
+                vertical_page_template = _compile_page_template(
+                    POSTS_TEMPLATE.replace("# Recent Posts", f"# {vertical} Blogs"),
+                    CSS=css_content,
+                    PAGINATION_CSS=pagination_css,
                 )
-                output_path = Path(blogs_directory) / output_filename
 
-                with output_path.open("w", encoding="utf-8") as output_file:
-                    output_file.write(page_content)
+                formatted_vertical = vertical_slugs[vertical]
+
+                # Paginate the generated grid items so that every page has content
+                total_pages = (
+                    len(all_grid_items) + BLOGS_PER_PAGE - 1
+                ) // BLOGS_PER_PAGE
+
+                for page_num, page_grid_items in enumerate(
+                    _iter_page_grid_items(all_grid_items, BLOGS_PER_PAGE), start=1
+                ):
+                    pagination_controls = _create_pagination_controls(
+                        pagination_template,
+                        page_num,
+                        total_pages,
+                        f"verticals-{formatted_vertical}",
+                    )
 
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Created {output_path} with {len(page_grid_items)} grid items (page {page_num}/{total_pages})\n",
+                    # Add page suffix for pages after the first
+                    page_title_suffix = f" - Page {page_num}" if page_num > 1 else ""
+                    page_description_suffix = (
+                        f" (Page {page_num} of {total_pages})" if page_num > 1 else ""
+                    )
+
+                    # Fill in the page body; the rest is streamed from the template
+                    page_html = dated_posts_template_html.replace(
+                        "{grid_items}", "\n".join(page_grid_items)
+                    )
+
+                    # Final validation: ensure page content is not empty
+                    if len(page_html.strip()) < 100:
+                        log_message(
+                            "warning",
+                            f"Generated page content is too small or empty for vertical {vertical} page {page_num}/{total_pages}. Skipping file creation.",
+                            "general",
+                            "__init__",
+                        )
+                        if log_file_handle:
+                            safe_log_write(
+                                log_file_handle,
+                                f"WARNING: Page content too small for vertical {vertical} page {page_num}/{total_pages}. Skipping file creation.\n",
+                            )
+                        continue
+
+                    # Determine output filename and write the file
+                    output_filename = (
+                        f"verticals-{formatted_vertical}.md"
+                        if page_num == 1
+                        else f"verticals-{formatted_vertical}-page{page_num}.md"
+                    )
+                    output_path = Path(blogs_directory) / output_filename
+
+                    yield (
+                        f"{len(page_grid_items)} grid items (page {page_num}/{total_pages})",
+                        output_path,
+                        vertical_page_template,
+                        {
+                            "HTML": page_html,
+                            "pagination_controls": pagination_controls,
+                            "page_title_suffix": page_title_suffix,
+                            "page_description_suffix": page_description_suffix,
+                            "current_page": page_num,
+                        },
                     )
+
+        # Every (vertical, page) pair is independent; each page is written
+        # while the next ones are built, so only pending writes hold their HTML
+        for summary, output_path in _write_page_files(build_vertical_page_jobs()):
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle, f"Created {output_path} with {summary}\n"
+                )
     except Exception as verticals_page_error:
         error_message = f"Failed to create verticals pages: {verticals_page_error}"
         log_message("error", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
+
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
+
+    # Blogs tagged with several verticals appear on each of their pages, so
+    # share rendered grid items across the verticals
+    vertical_grid_cache = {}
 
     # Generate individual vertical pages using Jinja2 templating
-    verticals = rocm_blogs.blogs.blogs_verticals
     for vertical in verticals:
         used_blogs = []
 
-        vertical_blogs = rocm_blogs.blogs.get_blogs_by_vertical(vertical)
-        vertical_blogs.sort(
-            key=lambda blog: getattr(blog, "date", datetime.now()), reverse=True
+        vertical_blogs = list(
+            _with_sort_dates(rocm_blogs.blogs.get_blogs_by_vertical(vertical))
         )
 
-        ecosystem_blogs = [
-            blog
-            for blog in vertical_blogs
-            if hasattr(blog, "category") and blog.category == "Ecosystems and Partners"
-        ]
-        application_blogs = [
-            blog
-            for blog in vertical_blogs
-            if hasattr(blog, "category") and blog.category == "Applications & models"
-        ]
-        software_blogs = [
-            blog
-            for blog in vertical_blogs
-            if hasattr(blog, "category")
-            and blog.category == "Software tools & optimizations"
-        ]
+        # Each category grid can lose at most the main grid's blogs to
+        # deduplication, so its newest blogs up to that bound are the
+        # candidates; older blogs are only rendered to fill a short grid
+        category_blogs_needed = MAIN_GRID_BLOGS_COUNT + CATEGORY_GRID_BLOGS_COUNT
 
-        main_grid_items = _generate_grid_items(
-            rocm_blogs, vertical_blogs, MAIN_GRID_BLOGS_COUNT, used_blogs, True, False
-        )
-        ecosystem_grid_items = _generate_grid_items(
-            rocm_blogs,
-            ecosystem_blogs,
-            CATEGORY_GRID_BLOGS_COUNT,
-            used_blogs,
-            True,
-            False,
-        )
-        application_grid_items = _generate_grid_items(
+        # Bucket the vertical's blogs by category in a single pass
+        category_buckets = [[] for _ in GRID_CATEGORY_IDS]
+        for blog in vertical_blogs:
+            if blog.category_id >= 0:
+                category_buckets[blog.category_id].append(blog)
+
+        main_grid_items = _generate_newest_grid_items(
             rocm_blogs,
-            application_blogs,
-            CATEGORY_GRID_BLOGS_COUNT,
+            vertical_blogs,
+            MAIN_GRID_BLOGS_COUNT,
+            MAIN_GRID_BLOGS_COUNT,
             used_blogs,
-            True,
-            False,
+            vertical_grid_cache,
         )
-        software_grid_items = _generate_grid_items(
-            rocm_blogs,
-            software_blogs,
-            CATEGORY_GRID_BLOGS_COUNT,
-            used_blogs,
-            True,
-            False,
+        ecosystem_grid_items, application_grid_items, software_grid_items = (
+            _generate_newest_grid_items(
+                rocm_blogs,
+                category_bucket,
+                CATEGORY_GRID_BLOGS_COUNT,
+                category_blogs_needed,
+                used_blogs,
+                vertical_grid_cache,
+            )
+            for category_bucket in category_buckets
         )
 
         # Check if we have any content at all for this vertical
@@ -3748,9 +4152,7 @@ def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             continue
 
         # Format the vertical name for links
-        formatted_vertical = vertical.replace(" ", "-").replace("&", "and").lower()
-        formatted_vertical = re.sub(r"[^a-z0-9-]", "", formatted_vertical)
-        formatted_vertical = re.sub(r"-+", "-", formatted_vertical)
+        formatted_vertical = vertical_slugs[vertical]
 
         # Use Jinja2 template rendering instead of string manipulation
         updated_html = process_templates_for_vertical(
@@ -3764,12 +4166,11 @@ def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
         )
 
         output_filename = vertical.replace(" ", "-").lower()
-        output_filename = re.sub(r"[^a-z0-9-]", "", output_filename)
+        output_filename = _strip_invalid_slug_chars(output_filename)
         output_filename = f"{output_filename}.md"
         output_path = Path(blogs_directory) / output_filename
 
-        with output_path.open("w", encoding="utf-8") as output_file:
-            output_file.write(updated_html)
+        write_file_if_changed(output_path, updated_html.encode("utf-8"))
 
         if log_file_handle:
             safe_log_write(
@@ -3782,7 +4183,7 @@ def update_vertical_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
     _BUILD_PHASES["update_vertical_pages"] = phase_duration
     log_message(
         "info",
-        "Vertical pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
+        f"Vertical pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
         "general",
         "__init__",
     )
@@ -3817,9 +4218,7 @@ def update_category_verticals(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None
             safe_log_write(log_file_handle, "-" * 80 + "\n\n")
 
         # Load templates and styles
-        pagination_template = import_file("rocm_blogs.templates", "pagination.html")
-        css_content = import_file("rocm_blogs.static.css", "index.css")
-        pagination_css = import_file("rocm_blogs.static.css", "pagination.css")
+        pagination_template, css_content, pagination_css = _load_pagination_assets()
 
         if log_file_handle:
             safe_log_write(
@@ -3848,129 +4247,130 @@ def update_category_verticals(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None
             log_file_handle, f"Found {len(keys)} vertical-category combinations\n"
         )
 
-        # Process each vertical-category combination
-        for key in keys:
-            total_pages_processed += 1
-            category, vertical = key
-
-            safe_log_write(
-                log_file_handle,
-                f"\nProcessing vertical-category: {vertical} - {category}\n",
-            )
-
-            # Get blogs for this vertical-category combination
-            category_vertical_blogs = rocm_blogs.blogs.get_vertical_category_blogs(
-                category, vertical
-            )
-
-            if not category_vertical_blogs:
-                safe_log_write(
-                    log_file_handle,
-                    f"No blogs found for category {category} and vertical {vertical}\n",
+        # Every page generated in this phase carries the same timestamp
+        current_datetime = current_timestamp()
+
+        # Page fields that depend only on the category are shared by every
+        # vertical it is paired with, so build them once per category
+        category_fields = {}
+        for category, _ in keys:
+            if category not in category_fields:
+                title_category = _titleize(category)
+                category_fields[category] = (
+                    title_category,
+                    title_category.lower(),
+                    AND_WORD_PATTERN.sub("&", f"{category}, AMD, ROCm"),
                 )
-                continue
-
-            safe_log_write(
-                log_file_handle,
-                f"Found {len(category_vertical_blogs)} blogs for category {category} and vertical {vertical}\n",
-            )
 
-            page_name = f"{vertical}-{category}".lower()
-            page_name = page_name.replace("&", "and")
-            page_name = page_name.replace(" ", "-")
-            page_name = re.sub(r"[^a-z0-9-]", "", page_name)
-            page_name = re.sub(r"-+", "-", page_name)
+        # Process the vertical-category combinations concurrently; each one
+        # writes its own set of pages. Each combination logs to its own
+        # buffer, which is written out in combination order.
+        category_logs = []
+        category_futures = []
+        with ThreadPoolExecutor() as executor:
+            for key in keys:
+                total_pages_processed += 1
+                category, vertical_name = key
+                category_log = io.StringIO() if log_file_handle else None
+                category_logs.append(category_log)
+
+                # Get blogs for this vertical-category combination
+                category_vertical_blogs = rocm_blogs.blogs.get_vertical_category_blogs(
+                    category, vertical_name
+                )
 
-            safe_log_write(
-                log_file_handle,
-                f"Creating title from vertical and category: {vertical} - {category}\n",
-            )
+                if not category_vertical_blogs:
+                    safe_log_write(
+                        category_log,
+                        f"\nProcessing vertical-category: {vertical_name} - {category}\n"
+                        f"No blogs found for category {category} and vertical {vertical_name}\n",
+                    )
+                    continue
 
-            if vertical.lower() == "ai":
-                vertical = "AI"
-                title_vertical = vertical
-            elif vertical.lower() == "hpc":
-                vertical = "HPC"
-                title_vertical = vertical
-            else:
-                # Apply title case to each word
-                words_vertical = vertical.split(" ")
-                title_vertical = " ".join(word.capitalize() for word in words_vertical)
-            title_vertical = title_vertical.replace("and", "&").replace("And", "&")
+                page_name = _slugify(f"{vertical_name}-{category}")
 
-            safe_log_write(
-                log_file_handle, f"Formatted vertical name: {title_vertical}\n"
-            )
+                if vertical_name.lower() in ("ai", "hpc"):
+                    vertical = vertical_name.upper()
+                else:
+                    vertical = vertical_name
+                title_vertical = _titleize(vertical)
 
-            words_category = category.split(" ")
-            title_category = (
-                " ".join(
-                    word.upper() if word.lower() == "ai" else word.capitalize()
-                    for word in words_category
+                title_category, category_description, category_keywords = (
+                    category_fields[category]
                 )
-                .replace("and", "&")
-                .replace("And", "&")
-            )
+                page_title = f"{title_vertical} - {title_category}"
+
+                filter_info = {
+                    "name": page_title,
+                    "template": "category_vertical.html",
+                    "output_base": page_name,
+                    "category_key": category,
+                    "title": page_title,
+                    "description": f"Explore the latest blogs about {category_description} in the {title_vertical} market vertical, including case studies, implementations, and best practices.",
+                    "keywords": f"{AND_WORD_PATTERN.sub('&', vertical)}, {category_keywords}",
+                    "filter_criteria": {"category": [category], "vertical": [vertical]},
+                }
 
-            if category.lower() == "ai" or category.lower() == "hpc":
-                title_category = title_category.upper()
+                # Log the whole combination in one write
+                if category_log:
+                    safe_log_write(
+                        category_log,
+                        f"\nProcessing vertical-category: {vertical_name} - {category}\n"
+                        f"Found {len(category_vertical_blogs)} blogs for category {category} and vertical {vertical_name}\n"
+                        f"Creating title from vertical and category: {vertical_name} - {category}\n"
+                        f"Formatted vertical name: {title_vertical}\n"
+                        f"Created filter info: {filter_info}\n",
+                    )
 
-            if category.lower() == "ai":
-                title_category = "AI"
-            elif category.lower() == "hpc":
-                title_category = "HPC"
-            else:
-                words_category = category.split(" ")
-                title_category = " ".join(word.capitalize() for word in words_category)
-            title_category = title_category.replace("and", "&").replace("And", "&")
-
-            filter_info = {
-                "name": f"{title_vertical} - {title_category}",
-                "template": "category_vertical.html",
-                "output_base": page_name,
-                "category_key": category,
-                "title": f"{title_vertical} - {title_category}",
-                "description": f"Explore the latest blogs about {title_category.lower()} in the {title_vertical} market vertical, including case studies, implementations, and best practices.",
-                "keywords": f"{vertical}, {category}, AMD, ROCm".replace("and", "&"),
-                "filter_criteria": {"category": [category], "vertical": [vertical]},
-            }
+                category_futures.append(
+                    (
+                        executor.submit(
+                            _process_category,
+                            filter_info,
+                            rocm_blogs,
+                            blogs_directory,
+                            pagination_template,
+                            css_content,
+                            pagination_css,
+                            current_datetime,
+                            CATEGORY_TEMPLATE,
+                            None,
+                            category_log,
+                        ),
+                        vertical,
+                        category,
+                        category_log,
+                    )
+                )
 
-            safe_log_write(log_file_handle, f"Created filter info: {filter_info}\n")
+            for future, vertical, category, category_log in category_futures:
+                try:
+                    future.result()
 
-            try:
-                _process_category(
-                    filter_info,
-                    rocm_blogs,
-                    blogs_directory,
-                    pagination_template,
-                    css_content,
-                    pagination_css,
-                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-                    CATEGORY_TEMPLATE,
-                    None,
-                    log_file_handle,
-                )
+                    total_pages_successful += 1
+                    safe_log_write(
+                        category_log,
+                        f"Successfully processed vertical-category: {vertical} - {category}\n",
+                    )
 
-                total_pages_successful += 1
-                safe_log_write(
-                    log_file_handle,
-                    f"Successfully processed vertical-category: {vertical} - {category}\n",
-                )
+                except Exception as processing_error:
+                    error_message = f"Error processing vertical-category {vertical} - {category}: {processing_error}"
+                    log_message("error", error_message, "general", "__init__")
 
-            except Exception as processing_error:
-                error_message = f"Error processing vertical-category {vertical} - {category}: {processing_error}"
-                log_message("error", error_message, "general", "__init__")
+                    if category_log:
+                        safe_log_write(category_log, f"ERROR: {error_message}\n")
+                        safe_log_write(
+                            category_log, f"Traceback: {traceback.format_exc()}\n"
+                        )
 
-                if log_file_handle:
-                    safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
-                    safe_log_write(
-                        log_file_handle, f"Traceback: {traceback.format_exc()}\n"
+                    total_pages_error += 1
+                    all_error_details.append(
+                        _ErrorDetail(f"{vertical} - {category}", str(processing_error))
                     )
 
-                total_pages_error += 1
-                all_error_details.append(
-                    {"page": f"{vertical} - {category}", "error": str(processing_error)}
-                )
+        for category_log in category_logs:
+            if category_log is not None:
+                safe_log_write(log_file_handle, category_log.getvalue())
 
         safe_log_write(
             log_file_handle, "\nNo additional custom filter pages will be generated\n"
@@ -3980,7 +4380,7 @@ def update_category_verticals(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None
         _BUILD_PHASES[phase_name] = phase_duration
         log_message(
             "info",
-            "Multi-filter pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Multi-filter pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -3994,13 +4394,14 @@ def update_category_verticals(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None
     except Exception as generation_error:
         error_message = f"Failed to generate multi-filter pages: {generation_error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
         _BUILD_PHASES[phase_name] = time.time() - phase_start_time
         _CRITICAL_ERROR_OCCURRED = True
@@ -4011,32 +4412,24 @@ def update_category_verticals(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None
             end_time = time.time()
             total_duration = end_time - phase_start_time
 
-            safe_log_write(log_file_handle, "\n" + "=" * 80 + "\n")
-            safe_log_write(log_file_handle, "MULTI-FILTER PAGES GENERATION SUMMARY\n")
-            safe_log_write(log_file_handle, "-" * 80 + "\n")
-            safe_log_write(
-                log_file_handle, f"Total pages processed: {total_pages_processed}\n"
-            )
-            safe_log_write(
-                log_file_handle, f"Total pages successful: {total_pages_successful}\n"
-            )
-            safe_log_write(
-                log_file_handle, f"Total pages with errors: {total_pages_error}\n"
-            )
-            safe_log_write(
-                log_file_handle, f"Total time: {total_duration:.2f} seconds\n"
-            )
+            summary_lines = [
+                "\n" + "=" * 80,
+                "MULTI-FILTER PAGES GENERATION SUMMARY",
+                "-" * 80,
+                f"Total pages processed: {total_pages_processed}",
+                f"Total pages successful: {total_pages_successful}",
+                f"Total pages with errors: {total_pages_error}",
+                f"Total time: {total_duration:.2f} seconds",
+            ]
 
             if all_error_details:
-                safe_log_write(log_file_handle, "\nERROR DETAILS:\n")
-                safe_log_write(log_file_handle, "-" * 80 + "\n")
+                summary_lines += ["\nERROR DETAILS:", "-" * 80]
                 for index, error_detail in enumerate(all_error_details):
-                    safe_log_write(
-                        log_file_handle, f"{index+1}. Page: {error_detail['page']}\n"
-                    )
-                    safe_log_write(
-                        log_file_handle, f"   Error: {error_detail['error']}\n\n"
-                    )
+                    summary_lines.append(f"{index+1}. Page: {error_detail.name}")
+                    summary_lines.append(f"   Error: {error_detail.error}\n")
+
+            # Emit the whole summary with a single write
+            safe_log_write(log_file_handle, "\n".join(summary_lines) + "\n")
 
             safe_log_close(log_file_handle)
 
@@ -4065,9 +4458,7 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             safe_log_write(log_file_handle, "-" * 80 + "\n\n")
 
         # Load templates and styles
-        pagination_template = import_file("rocm_blogs.templates", "pagination.html")
-        css_content = import_file("rocm_blogs.static.css", "index.css")
-        pagination_css = import_file("rocm_blogs.static.css", "pagination.css")
+        pagination_template, css_content, pagination_css = _load_pagination_assets()
 
         if log_file_handle:
             safe_log_write(
@@ -4083,7 +4474,7 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             )
 
         # Current datetime for template
-        current_datetime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        current_datetime = current_timestamp()
 
         # Process each category
         if log_file_handle:
@@ -4091,76 +4482,101 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
                 log_file_handle, f"Processing {len(BLOG_CATEGORIES)} categories\n"
             )
 
-        for category_info in BLOG_CATEGORIES:
-            total_categories_processed += 1
-            category_name = category_info["name"]
+        # Categories write disjoint sets of pages, so process them concurrently
+        category_futures = {}
+        with ThreadPoolExecutor() as executor:
+            for category_info in BLOG_CATEGORIES:
+                total_categories_processed += 1
+                category_name = category_info["name"]
 
-            if log_file_handle:
-                safe_log_write(
-                    log_file_handle, f"\nProcessing category: {category_name}\n"
-                )
-                safe_log_write(
-                    log_file_handle, f"  Output base: {category_info['output_base']}\n"
-                )
-                safe_log_write(
-                    log_file_handle,
-                    f"  Category key: {category_info['category_key']}\n",
+                if log_file_handle:
+                    safe_log_write(
+                        log_file_handle,
+                        f"\nProcessing category: {category_name}\n"
+                        f"  Output base: {category_info['output_base']}\n"
+                        f"  Category key: {category_info['category_key']}\n",
+                    )
+
+                category_key = category_info["category_key"]
+                category_blogs = rocm_blogs.blogs.blogs_categories.get(
+                    category_key, []
                 )
 
-            category_key = category_info["category_key"]
-            category_blogs = rocm_blogs.blogs.blogs_categories.get(category_key, [])
+                # An empty category produces no pages, so don't schedule it
+                if not category_blogs:
+                    log_message(
+                        "warning",
+                        f"No blogs found for category: {category_name}",
+                        "general",
+                        "__init__",
+                    )
 
-            category_info["title"] = (
-                category_info.get("title", category_name)
-                .capitalize()
-                .replace("and", "&")
-                .replace("And", "&")
-            )
+                    if log_file_handle:
+                        safe_log_write(
+                            log_file_handle,
+                            f"Skipping empty category: {category_name}\n",
+                        )
+                    continue
 
-            try:
-                _process_category(
-                    category_info,
-                    rocm_blogs,
-                    blogs_directory,
-                    pagination_template,
-                    css_content,
-                    pagination_css,
-                    current_datetime,
-                    CATEGORY_TEMPLATE,
-                    category_blogs,
-                )
+                # Normalize the title on a copy so BLOG_CATEGORIES stays untouched
+                page_info = {
+                    **category_info,
+                    "title": _category_page_title(
+                        category_info.get("title", category_name)
+                    ),
+                }
 
-                total_categories_successful += 1
+                category_futures[
+                    executor.submit(
+                        _process_category,
+                        page_info,
+                        rocm_blogs,
+                        blogs_directory,
+                        pagination_template,
+                        css_content,
+                        pagination_css,
+                        current_datetime,
+                        CATEGORY_TEMPLATE,
+                        category_blogs,
+                    )
+                ] = category_name
 
-                total_pages_created += 1
+            for future in as_completed(category_futures):
+                category_name = category_futures[future]
+                try:
+                    future.result()
 
-                if log_file_handle:
-                    safe_log_write(
-                        log_file_handle,
-                        f"Successfully processed category: {category_name}\n",
-                    )
+                    total_categories_successful += 1
 
-            except Exception as category_processing_error:
-                error_message = f"Error processing category {category_name}: {category_processing_error}"
-                log_message("error", error_message, "general", "__init__")
+                    total_pages_created += 1
 
-                if log_file_handle:
-                    safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
-                    safe_log_write(
-                        log_file_handle, f"Traceback: {traceback.format_exc()}\n"
-                    )
+                    if log_file_handle:
+                        safe_log_write(
+                            log_file_handle,
+                            f"Successfully processed category: {category_name}\n",
+                        )
 
-                total_categories_error += 1
-                all_error_details.append(
-                    {"category": category_name, "error": str(category_processing_error)}
-                )
+                except Exception as category_processing_error:
+                    error_message = f"Error processing category {category_name}: {category_processing_error}"
+                    log_message("error", error_message, "general", "__init__")
+
+                    if log_file_handle:
+                        safe_log_write(log_file_handle, f"ERROR: {error_message}\n")
+                        safe_log_write(
+                            log_file_handle, f"Traceback: {traceback.format_exc()}\n"
+                        )
+
+                    total_categories_error += 1
+                    all_error_details.append(
+                        _ErrorDetail(category_name, str(category_processing_error))
+                    )
 
         # Record timing information
         phase_duration = time.time() - phase_start_time
         _BUILD_PHASES["update_category_pages"] = phase_duration
         log_message(
             "info",
-            "Category pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
+            f"Category pages generation completed in \033[96m{phase_duration:.2f} seconds\033[0m",
             "general",
             "__init__",
         )
@@ -4174,13 +4590,14 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
     except Exception as category_error:
         error_message = f"Failed to generate category pages: {category_error}"
         log_message("critical", error_message, "general", "__init__")
-        log_message(
-            "debug", f"Traceback: {traceback.format_exc()}", "general", "__init__"
-        )
+        # Only format the traceback when something will record it
+        if log_file_handle or is_logging_enabled_from_config():
+            error_traceback = traceback.format_exc()
+            log_message("debug", f"Traceback: {error_traceback}", "general", "__init__")
 
-        if log_file_handle:
-            safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
-            safe_log_write(log_file_handle, f"Traceback: {traceback.format_exc()}\n")
+            if log_file_handle:
+                safe_log_write(log_file_handle, f"CRITICAL ERROR: {error_message}\n")
+                safe_log_write(log_file_handle, f"Traceback: {error_traceback}\n")
 
         _BUILD_PHASES["update_category_pages"] = time.time() - phase_start_time
         _CRITICAL_ERROR_OCCURRED = True
@@ -4191,39 +4608,25 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
             end_time = time.time()
             total_duration = end_time - phase_start_time
 
-            safe_log_write(log_file_handle, "\n" + "=" * 80 + "\n")
-            safe_log_write(log_file_handle, "CATEGORY PAGES GENERATION SUMMARY\n")
-            safe_log_write(log_file_handle, "-" * 80 + "\n")
-            safe_log_write(
-                log_file_handle,
-                f"Total categories processed: {total_categories_processed}\n",
-            )
-            safe_log_write(
-                log_file_handle,
-                f"Total categories successful: {total_categories_successful}\n",
-            )
-            safe_log_write(
-                log_file_handle,
-                f"Total categories with errors: {total_categories_error}\n",
-            )
-            safe_log_write(
-                log_file_handle, f"Total pages created: {total_pages_created}\n"
-            )
-            safe_log_write(
-                log_file_handle, f"Total time: {total_duration:.2f} seconds\n"
-            )
+            summary_lines = [
+                "\n" + "=" * 80,
+                "CATEGORY PAGES GENERATION SUMMARY",
+                "-" * 80,
+                f"Total categories processed: {total_categories_processed}",
+                f"Total categories successful: {total_categories_successful}",
+                f"Total categories with errors: {total_categories_error}",
+                f"Total pages created: {total_pages_created}",
+                f"Total time: {total_duration:.2f} seconds",
+            ]
 
             if all_error_details:
-                safe_log_write(log_file_handle, "\nERROR DETAILS:\n")
-                safe_log_write(log_file_handle, "-" * 80 + "\n")
+                summary_lines += ["\nERROR DETAILS:", "-" * 80]
                 for index, error_detail in enumerate(all_error_details):
-                    safe_log_write(
-                        log_file_handle,
-                        f"{index+1}. Category: {error_detail['category']}\n",
-                    )
-                    safe_log_write(
-                        log_file_handle, f"   Error: {error_detail['error']}\n\n"
-                    )
+                    summary_lines.append(f"{index+1}. Category: {error_detail.name}")
+                    summary_lines.append(f"   Error: {error_detail.error}\n")
+
+            # Emit the whole summary with a single write
+            safe_log_write(log_file_handle, "\n".join(summary_lines) + "\n")
 
             safe_log_close(log_file_handle)
 
@@ -4231,10 +4634,16 @@ def update_category_pages(sphinx_app: Sphinx, rocm_blogs: ROCmBlogs) -> None:
 @log_project_info
 def setup(sphinx_app: Sphinx) -> dict:
     """Set up the ROCm Blogs extension."""
-    global _CRITICAL_ERROR_OCCURRED, structured_logger
+    global _CRITICAL_ERROR_OCCURRED, structured_logger, _initialized, _BUILD_START_TIME
     phase_start_time = time.time()
     phase_name = "setup"
 
+    # Start the build clock and logging on first setup rather than at import
+    if not _initialized:
+        _initialized = True
+        _BUILD_START_TIME = phase_start_time
+        _initialize_structured_logging()
+
     sphinx_diagnostics.info(f"Setting up ROCm Blogs extension, version: {__version__}")
     sphinx_diagnostics.info(
         f"Build process started at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(_BUILD_START_TIME))}"
@@ -4481,7 +4890,7 @@ def _initialize_shared_rocm_blogs(sphinx_app: Sphinx) -> ROCmBlogs:
 
         rocm_blogs.blogs_directory = str(blogs_directory)
         log_message(
-            "info", "Found blogs directory: {blogs_directory}", "general", "__init__"
+            "info", f"Found blogs directory: {blogs_directory}", "general", "__init__"
         )
 
         # Find README files
@@ -4500,12 +4909,8 @@ def _initialize_shared_rocm_blogs(sphinx_app: Sphinx) -> ROCmBlogs:
         rocm_blogs.blogs.sort_blogs_by_date()
         log_message("info", "Sorted blogs by date", "general", "__init__")
 
-        # Extract category keys from BLOG_CATEGORIES to use for sorting
-        category_keys = [
-            category_info.get("category_key", category_info["name"])
-            for category_info in BLOG_CATEGORIES
-        ]
-        rocm_blogs.blogs.sort_blogs_by_category(category_keys)
+        # Bucket the blogs by the category keys from BLOG_CATEGORIES
+        rocm_blogs.blogs.sort_blogs_by_category(BLOG_CATEGORY_KEYS)
         log_message("info", "Sorted blogs by category", "general", "__init__")
 
         log_message(
@@ -4531,11 +4936,19 @@ def _initialize_shared_rocm_blogs(sphinx_app: Sphinx) -> ROCmBlogs:
 
 def _create_event_handler_with_shared_instance(func, rocm_blogs):
     """Create an event handler that passes the shared ROCmBlogs instance to the function."""
+    return functools.partial(func, rocm_blogs=rocm_blogs)
 
-    def handler(sphinx_app):
-        return func(sphinx_app, rocm_blogs)
 
-    return handler
+# Phases run on builder-inited, in the order they are connected
+_BUILDER_INITED_HANDLERS = (
+    run_metadata_generator,
+    update_index_file,
+    blog_generation,
+    update_posts_file,
+    update_vertical_pages,
+    update_category_pages,
+    update_category_verticals,
+)
 
 
 def _register_event_handlers(sphinx_app: Sphinx) -> None:
@@ -4544,50 +4957,15 @@ def _register_event_handlers(sphinx_app: Sphinx) -> None:
         # Initialize shared ROCmBlogs instance
         shared_rocm_blogs = _initialize_shared_rocm_blogs(sphinx_app)
 
-        # Register event handlers with shared instance
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                run_metadata_generator, shared_rocm_blogs
-            ),
-        )
+        # Register event handlers with shared instance, in build order
+        for handler_function in _BUILDER_INITED_HANDLERS:
+            sphinx_app.connect(
+                "builder-inited",
+                _create_event_handler_with_shared_instance(
+                    handler_function, shared_rocm_blogs
+                ),
+            )
 
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                update_index_file, shared_rocm_blogs
-            ),
-        )
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                blog_generation, shared_rocm_blogs
-            ),
-        )
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                update_posts_file, shared_rocm_blogs
-            ),
-        )
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                update_vertical_pages, shared_rocm_blogs
-            ),
-        )
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                update_category_pages, shared_rocm_blogs
-            ),
-        )
-        sphinx_app.connect(
-            "builder-inited",
-            _create_event_handler_with_shared_instance(
-                update_category_verticals, shared_rocm_blogs
-            ),
-        )
         sphinx_app.connect("build-finished", log_total_build_time)
 
         log_message(
@@ -22,6 +22,7 @@ class ROCmBlogs:
         self.sphinx_env = None
         self.blogs = BlogHolder()
         self.blog_paths: list[str] = []
+        self.blog_path_stats: dict[str, tuple[int, int]] = {}
         self.author_paths: list[str] = []
         self.categories = []
         self.tags = []
@@ -61,7 +62,7 @@ class ROCmBlogs:
 
         # If no valid cache is available, perform a fresh scan.
         log_message(
-            "info", "Scanning {root} for README.md files...", "general", "_rocmblogs"
+            "info", f"Scanning {root} for README.md files...", "general", "_rocmblogs"
         )
 
         candidates = list(root.rglob("README.md"))
@@ -113,28 +114,14 @@ class ROCmBlogs:
             "_rocmblogs",
         )
         log_message(
-            "info", "Scanning {root} for README.md files...", "general", "_rocmblogs"
+            "info", f"Scanning {root} for README.md files...", "general", "_rocmblogs"
         )
 
-        candidates = list(root.rglob("README.md"))
-        log_message(
-            "debug",
-            f"Found {len(candidates)} candidate README.md files",
-            "general",
-            "_rocmblogs",
-        )
-
-        def process_path(path: Path) -> str | None:
-            """Check if path is file and return path."""
-
-            if path.is_file():
-                return str(path.resolve())
-            return None
-
-        with ThreadPoolExecutor() as executor:
-            results = list(executor.map(process_path, candidates))
-
-        readme_files = [result for result in results if result is not None]
+        # Walk the tree with scandir so the README stat results come from the
+        # directory scan; keep (mtime_ns, size) for change detection later
+        readme_stats = {}
+        self._scan_readme_files(str(root.resolve()), readme_stats)
+        readme_files = list(readme_stats)
 
         if not readme_files:
             log_message("critical", "No 'README.md' files found in the blogs directory")
@@ -148,6 +135,53 @@ class ROCmBlogs:
         )
 
         self.blog_paths = readme_files
+        self.blog_path_stats = readme_stats
+
+    def _scan_readme_files(
+        self, directory: str, readme_stats: dict[str, tuple[int, int]]
+    ) -> None:
+        """Record the README.md files under directory, in directory walk order."""
+
+        # Walk with an explicit stack rather than recursion so deep trees
+        # cannot hit the recursion limit; pushing each directory's children
+        # in reverse keeps the same depth-first order as the recursive walk
+        pending_directories = [directory]
+        while pending_directories:
+            subdirectories = []
+            try:
+                with os.scandir(pending_directories.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.name == "README.md" and entry.is_file():
+                                readme_path = entry.path
+                                if entry.is_symlink():
+                                    readme_path = os.path.realpath(readme_path)
+                                readme_stat = entry.stat()
+                                readme_stats[readme_path] = (
+                                    readme_stat.st_mtime_ns,
+                                    readme_stat.st_size,
+                                )
+                            elif entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+            pending_directories.extend(reversed(subdirectories))
+
+    def refresh_readme_stats(self) -> None:
+        """Re-stat the README files already found, without walking the tree."""
+
+        readme_stats = {}
+        for readme_path in self.blog_paths:
+            try:
+                readme_stat = os.stat(readme_path)
+            except OSError:
+                continue
+            readme_stats[readme_path] = (readme_stat.st_mtime_ns, readme_stat.st_size)
+
+        self.blog_path_stats = readme_stats
 
     def process_path(self, path: Path) -> str | None:
         """Check if path is file and return path."""
@@ -168,7 +202,7 @@ class ROCmBlogs:
             "_rocmblogs",
         )
         log_message(
-            "info", "Scanning {root} for author directory", "general", "_rocmblogs"
+            "info", f"Scanning {root} for author directory", "general", "_rocmblogs"
         )
 
         author_directory = root / "authors"
@@ -196,7 +230,7 @@ class ROCmBlogs:
         for author in author_files:
             if not author.endswith(".md"):
                 log_message(
-                    "info", "Found markdown file: {author}", "general", "_rocmblogs"
+                    "info", f"Found markdown file: {author}", "general", "_rocmblogs"
                 )
 
         if not author_files:
@@ -243,7 +277,7 @@ class ROCmBlogs:
             if candidate.is_dir():
                 log_message(
                     "info",
-                    "Found blogs directory at: {candidate}",
+                    f"Found blogs directory at: {candidate}",
                     "general",
                     "_rocmblogs",
                 )
@@ -268,7 +302,7 @@ class ROCmBlogs:
 
         file_path = self.blog_paths[0]
         log_message(
-            "info", "Extracting metadata from {file_path}", "general", "_rocmblogs"
+            "info", f"Extracting metadata from {file_path}", "general", "_rocmblogs"
         )
 
         with open(file_path, "r", encoding="utf-8") as file:
@@ -400,7 +434,7 @@ class ROCmBlogs:
                     )
                     log_message(
                         "info",
-                        "Using directory name as blog title for {filename}: {blog.blog_title}",
+                        f"Using directory name as blog title for {filename}: {blog.blog_title}",
                         "general",
                         "_rocmblogs",
                     )
@@ -414,7 +448,7 @@ class ROCmBlogs:
                     )
                     log_message(
                         "info",
-                        "Using filename as blog title: {blog.blog_title}",
+                        f"Using filename as blog title: {blog.blog_title}",
                         "general",
                         "_rocmblogs",
                     )
@@ -442,7 +476,7 @@ class ROCmBlogs:
                     )
 
             # Check for category attribute
-            if not hasattr(blog, "category") or not blog.category:
+            if not blog.category:
                 # Try to use parent directory name as category
                 parent_dir = os.path.basename(os.path.dirname(file_path))
                 if parent_dir and parent_dir.lower() not in "blogs":
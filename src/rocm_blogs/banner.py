@@ -3,12 +3,12 @@ Banner slider generation for ROCm Blogs.
 """
 
 import os
-import re
 import traceback
 
 from PIL import Image
 from sphinx.util import logging as sphinx_logging
 
+from .constants import NON_ALPHANUMERIC_RUN_PATTERN
 from .logger.logger import *
 
 
@@ -136,12 +136,13 @@ def generate_banner_slide(blog, rocmblogs, index: int = 0, active: bool = False)
     log_message(
         "info", f"Step 4: Processing category information", "slide_generation", "banner"
     )
-    category = getattr(blog, "category", "ROCm Blog")
+    category = blog.category or "ROCm Blog"
     category_link = category.lower().replace(" ", "-")
 
     # split, remove special characters, and convert to lowercase then join
     category_link = "-".join(
-        re.sub(r"[^a-z0-9]+", "-", part.strip().lower()) for part in category.split("-")
+        NON_ALPHANUMERIC_RUN_PATTERN.sub("-", part.strip().lower())
+        for part in category.split("-")
     ).lower()
 
     category_url = f"./{category_link}.html"
@@ -749,7 +750,7 @@ def generate_banner_navigation_item(blog, index: int = 0, active: bool = False)
     </div>"""
 
     title = blog.blog_title if hasattr(blog, "blog_title") else "No Title"
-    category = getattr(blog, "category", "ROCm Blog")
+    category = blog.category or "ROCm Blog"
 
     log_message(
         "debug",
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Union
 from PIL import Image
 from sphinx.util import logging as sphinx_logging
 
+from .constants import GRID_CATEGORY_IDS
 from .logger.logger import *
 
 # Global caches for performance optimization during blog processing
@@ -109,6 +110,11 @@ class Blog:
         self.image_paths = []
         self.word_count = 0
 
+        # Attributes the page generators filter on, overridden by metadata below
+        self.blogpost = False
+        self.category = None
+        self.vertical = None
+
         # Dynamically assign attributes based on metadata dictionary contents
         for key, value in metadata.items():
             setattr(self, key, value)
@@ -117,6 +123,14 @@ class Blog:
             self.parse_date(metadata.get("date")) if "date" in metadata else None
         )
 
+    @property
+    def category_id(self) -> int:
+        """Return the grid index of the blog's category, or -1 if it has none."""
+        # Derived on access so it follows any later reassignment of category
+        if not isinstance(self.category, str):
+            return -1
+        return GRID_CATEGORY_IDS.get(self.category, -1)
+
     def set_word_count(self, word_count: int) -> None:
         """Set word count."""
         self.word_count = word_count
@@ -265,7 +279,7 @@ class Blog:
             with open(output_path, "wb") as file:
                 file.write(self.image)
                 log_message(
-                    "info", "Image saved to disk at: {output_path}", "general", "blog"
+                    "info", f"Image saved to disk at: {output_path}", "general", "blog"
                 )
         except Exception as error:
             log_message(
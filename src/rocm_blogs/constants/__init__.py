@@ -6,13 +6,62 @@ including configuration values, regex patterns, and default settings.
 """
 
 import re
+import string
 
 # Reading speed constants
 AVERAGE_READING_SPEED_WPM = 245
 
+# Month abbreviations for chart labels, independent of the current locale
+MONTH_ABBREVIATIONS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
 # Regex patterns
 SPECIAL_CHARS_PATTERN = re.compile(r"[!@#$%^&*?/|]")
 WHITESPACE_PATTERN_FOR_SLUGS = re.compile(r"\s+")
+REPEATED_DASHES_PATTERN = re.compile(r"-+")
+NON_ALPHANUMERIC_RUN_PATTERN = re.compile(r"[^a-z0-9]+")
+AND_WORD_PATTERN = re.compile(r"\band\b", re.IGNORECASE)
+AUTHOR_PLACEHOLDER_PATTERN = re.compile(r"\{(author_blogs|author_css|author)\}")
+AUTHOR_GRID_MARKER_PATTERN = re.compile(
+    r"^% rocm-blogs author grid: (\w+)$", re.MULTILINE
+)
+INDEX_PLACEHOLDER_PATTERN = re.compile(
+    r"\{(grid_items|eco_grid_items|application_grid_items|software_grid_items"
+    r"|featured_grid_items|banner_slider)\}"
+)
+
+# Build timestamp stamped into generated pages by the posts.html template
+GENERATED_TIMESTAMP_PATTERN = re.compile(
+    rb"Generated \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
+)
+
+# Patterns for cleaning generated grid markup
+ORPHANED_MARGIN_PATTERN = re.compile(r"\n:margin 2\n")
+EMPTY_GRID_PATTERN = re.compile(r"::::{grid}[^\n]*\n:margin 2\n\n::::")
+STACKED_GRID_COLONS_PATTERN = re.compile(r":+{grid}")
+
+# Translation table deleting ASCII characters that are not allowed in slugs
+SLUG_INVALID_CHARS_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(code)
+        for code in range(128)
+        if chr(code) not in string.ascii_lowercase + string.digits + "-"
+    ),
+)
 
 EXCLUDED_EXTENSIONS = [".gif", ".GIF"]
 
@@ -33,6 +82,9 @@ MARKDOWN_PATTERNS = {
     "whitespace": re.compile(r"\s+"),
 }
 
+# MyST comment line written above the generated section of an author page
+AUTHOR_GRID_MARKER = "% rocm-blogs author grid: {digest}\n"
+
 AUTHOR_TEMPLATE = """
 
 <style>
@@ -49,6 +101,21 @@ AUTHOR_TEMPLATE = """
 ::::
 """
 
+# Author table rows on the blog statistics page
+_STATISTICS_BLOG_CELLS = (
+    '<td class="blog-count">{blog_count}</td>'
+    '<td class="date"><a href="{latest_href}" class="blog-title">{latest_title}</a>'
+    '<br><span class="date-text">{latest_date}</span></td>'
+    '<td class="date"><a href="{first_href}" class="blog-title">{first_title}</a>'
+    '<br><span class="date-text">{first_date}</span></td></tr>'
+)
+STATISTICS_LINKED_AUTHOR_ROW_TEMPLATE = (
+    '<tr><td class="author"><a href="{href}">{name}</a></td>' + _STATISTICS_BLOG_CELLS
+)
+STATISTICS_AUTHOR_ROW_TEMPLATE = (
+    '<tr><td class="author">{name}</td>' + _STATISTICS_BLOG_CELLS
+)
+
 # Template constants
 INDEX_TEMPLATE = """---
 title: ROCm Blogs
@@ -163,6 +230,13 @@ WEBP_CONSERVATIVE_QUALITY = 95  # Increased for better quality
 WEBP_CONSERVATIVE_METHOD = 6  # Improved quality for conservative mode
 
 # Category definitions
+# Integer ids of the categories the index and vertical pages each give a grid
+GRID_CATEGORY_IDS = {
+    "Ecosystems and Partners": 0,
+    "Applications & models": 1,
+    "Software tools & optimizations": 2,
+}
+
 BLOG_CATEGORIES = [
     {
         "name": "Applications & Models",
@@ -215,3 +289,9 @@ BLOG_CATEGORIES = [
         },
     },
 ]
+
+# Category keys the blogs are bucketed by, in BLOG_CATEGORIES order
+BLOG_CATEGORY_KEYS = [
+    category_info.get("category_key", category_info["name"])
+    for category_info in BLOG_CATEGORIES
+]
@@ -8,33 +8,45 @@ from sphinx.util import logging as sphinx_logging
 from .logger.logger import *
 
 
-def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
-    """Takes a blog and creates a sphinx grid item with WebP image support."""
-    grid_start_time = time.time()
+def open_grid_log():
+    """Open the grid generation log for appending, or return None if logging is off."""
+    if not is_logging_enabled_from_config():
+        return None
+
+    try:
+        logs_dir = Path("logs")
+        logs_dir.mkdir(exist_ok=True)
+        return open(logs_dir / "grid_generation.log", "a", encoding="utf-8")
+    except Exception:
+        return None
 
-    log_file_handle = None
-    if is_logging_enabled_from_config():
-        try:
-            logs_dir = Path("logs")
-            logs_dir.mkdir(exist_ok=True)
-            log_filepath = logs_dir / "grid_generation.log"
 
-            log_file_handle = open(log_filepath, "a", encoding="utf-8")
-        except Exception as log_error:
-            log_file_handle = None
+def generate_grid(
+    ROCmBlogs, blog, lazy_load=False, use_og=False, log_file_handle=None
+) -> str:
+    """Takes a blog and creates a sphinx grid item with WebP image support.
 
-    safe_log_write(
-        log_file_handle,
-        f"Starting grid generation for blog - lazy_load: {lazy_load}, use_og: {use_og}\n",
-    )
+    Progress is written to log_file_handle, which callers open once with
+    open_grid_log() and share across every grid item they generate.
+    """
+    grid_start_time = time.time()
+
+    # Progress messages on the common path are only formatted when the grid
+    # log is open; with logging disabled they would be built and discarded
+    if log_file_handle:
+        safe_log_write(
+            log_file_handle,
+            f"Starting grid generation for blog - lazy_load: {lazy_load}, use_og: {use_og}\n",
+        )
 
     blog_title = blog.blog_title if hasattr(blog, "blog_title") else "No Title"
     blog_file_path = getattr(blog, "file_path", "Unknown path")
 
-    safe_log_write(
-        log_file_handle,
-        f"Grid generation details - Title: '{blog_title}', Path: '{blog_file_path}', use_og: {use_og}, lazy_load: {lazy_load}\n",
-    )
+    if log_file_handle:
+        safe_log_write(
+            log_file_handle,
+            f"Grid generation details - Title: '{blog_title}', Path: '{blog_file_path}', use_og: {use_og}, lazy_load: {lazy_load}\n",
+        )
 
     grid_template = """
 :::{{grid-item-card}}
@@ -54,27 +66,30 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
 """
 
     title = blog_title
-    safe_log_write(log_file_handle, f"Grid item title: '{title}'\n")
+    if log_file_handle:
+        safe_log_write(log_file_handle, f"Grid item title: '{title}'\n")
 
     date = blog.date.strftime("%B %d, %Y") if blog.date else "No Date"
-    safe_log_write(log_file_handle, f"Grid item date: '{date}'\n")
+    if log_file_handle:
+        safe_log_write(log_file_handle, f"Grid item date: '{date}'\n")
 
     description = "No Description"
     if hasattr(blog, "myst") and blog.myst:
         html_meta = blog.myst.get("html_meta", {})
         if html_meta and "description lang=en" in html_meta:
             description = html_meta["description lang=en"]
-            safe_log_write(
-                log_file_handle,
-                f"Using description from myst html_meta: '{description[:50]}...' (length: {len(description)})\n",
-            )
-        else:
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle,
+                    f"Using description from myst html_meta: '{description[:50]}...' (length: {len(description)})\n",
+                )
+        elif log_file_handle:
             html_meta_keys = list(html_meta.keys()) if html_meta else []
             safe_log_write(
                 log_file_handle,
                 f"Myst metadata found but no 'description lang=en' field. Available keys: {html_meta_keys}\n",
             )
-    else:
+    elif log_file_handle:
         has_myst = hasattr(blog, "myst")
         myst_value = getattr(blog, "myst", None)
         safe_log_write(
@@ -83,10 +98,11 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
         )
 
     authors_list = getattr(blog, "author", "").split(",")
-    safe_log_write(
-        log_file_handle,
-        f"Authors list for grid item: {authors_list} (count: {len(authors_list)})\n",
-    )
+    if log_file_handle:
+        safe_log_write(
+            log_file_handle,
+            f"Authors list for grid item: {authors_list} (count: {len(authors_list)})\n",
+        )
 
     if use_og:
         safe_log_write(
@@ -199,19 +215,21 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
         )
 
     else:
-        safe_log_write(
-            log_file_handle,
-            f"REGULAR MODE: Processing regular image for grid item: '{title}'\n",
-        )
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle,
+                f"REGULAR MODE: Processing regular image for grid item: '{title}'\n",
+            )
 
         if hasattr(blog, "thumbnail") and blog.thumbnail:
             thumbnail_path = blog.thumbnail
             webp_thumbnail_path = os.path.splitext(thumbnail_path)[0] + ".webp"
 
-            safe_log_write(
-                log_file_handle,
-                f"REGULAR MODE: Blog has thumbnail: '{thumbnail_path}', checking for WebP version: '{webp_thumbnail_path}'\n",
-            )
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle,
+                    f"REGULAR MODE: Blog has thumbnail: '{thumbnail_path}', checking for WebP version: '{webp_thumbnail_path}'\n",
+                )
 
             if os.path.exists(
                 os.path.join(ROCmBlogs.blogs_directory, webp_thumbnail_path)
@@ -245,18 +263,21 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
                     f"REGULAR MODE: No WebP version found for thumbnail: '{thumbnail_path}'\n",
                 )
 
-        safe_log_write(
-            log_file_handle, f"REGULAR MODE: Calling blog.grab_image() for: '{title}'\n"
-        )
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle,
+                f"REGULAR MODE: Calling blog.grab_image() for: '{title}'\n",
+            )
 
         try:
             image = blog.grab_image(ROCmBlogs)
             image_str = str(image)
 
-            safe_log_write(
-                log_file_handle,
-                f"REGULAR MODE: Retrieved image from blog.grab_image(): '{image_str}' (type: {type(image).__name__})\n",
-            )
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle,
+                    f"REGULAR MODE: Retrieved image from blog.grab_image(): '{image_str}' (type: {type(image).__name__})\n",
+                )
         except Exception as grab_image_error:
             safe_log_write(
                 log_file_handle,
@@ -274,10 +295,11 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
         image_str = image_str.replace("\\", "/")
         image = image_str
 
-        safe_log_write(
-            log_file_handle,
-            f"REGULAR MODE: Final processed image path: '{image_str}'\n",
-        )
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle,
+                f"REGULAR MODE: Final processed image path: '{image_str}'\n",
+            )
 
         if "generic.jpg" in image_str.lower():
             generic_webp_path = os.path.join(
@@ -448,9 +470,10 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
                         f"REGULAR MODE: Could not find original image file for conversion: '{image_str}'\n",
                     )
 
-        safe_log_write(
-            log_file_handle, f"REGULAR MODE: Final image for grid item: '{image}'\n"
-        )
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle, f"REGULAR MODE: Final image for grid item: '{image}'\n"
+            )
 
         try:
             raw_href = blog.grab_href()
@@ -459,10 +482,11 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
             else:
                 href = "." + str(raw_href).split("/blogs")[-1].replace("\\", "/")
 
-            safe_log_write(
-                log_file_handle,
-                f"REGULAR MODE: Generated href: '{href}' from raw_href: '{raw_href}'\n",
-            )
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle,
+                    f"REGULAR MODE: Generated href: '{href}' from raw_href: '{raw_href}'\n",
+                )
         except Exception as href_error:
             safe_log_write(
                 log_file_handle,
@@ -474,10 +498,11 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
     if authors_list:
         try:
             authors_html = blog.grab_authors(authors_list, ROCmBlogs)
-            safe_log_write(
-                log_file_handle,
-                f"Generated authors HTML: '{authors_html}' (count: {len(authors_list)})\n",
-            )
+            if log_file_handle:
+                safe_log_write(
+                    log_file_handle,
+                    f"Generated authors HTML: '{authors_html}' (count: {len(authors_list)})\n",
+                )
         except Exception as authors_error:
             safe_log_write(
                 log_file_handle,
@@ -486,9 +511,10 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
 
     if authors_html:
         authors_html = f"by {authors_html}"
-        safe_log_write(
-            log_file_handle, f"Final authors HTML with prefix: '{authors_html}'\n"
-        )
+        if log_file_handle:
+            safe_log_write(
+                log_file_handle, f"Final authors HTML with prefix: '{authors_html}'\n"
+            )
     else:
         safe_log_write(
             log_file_handle,
@@ -505,51 +531,42 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
             href=href,
         )
 
-        grid_end_time = time.time()
-        grid_duration = grid_end_time - grid_start_time
-
-        safe_log_write(
-            log_file_handle,
-            f"Successfully generated grid item for '{title}' in {grid_duration:.4f}s\n",
-        )
-        safe_log_write(
-            log_file_handle, f"Grid content length: {len(grid_content)} characters\n"
-        )
-
-        safe_log_write(
-            log_file_handle,
-            f"Generated grid content for '{title}':\n{'-' * 40}\n{grid_content}\n{'-' * 40}\n",
-        )
+        if log_file_handle:
+            grid_end_time = time.time()
+            grid_duration = grid_end_time - grid_start_time
 
-        if use_og:
             safe_log_write(
                 log_file_handle,
-                f"AUTHOR PAGE SUMMARY: '{title}' -> Image: '{image}', Href: '{href}', Mode: OpenGraph\n",
+                f"Successfully generated grid item for '{title}' in {grid_duration:.4f}s\n",
             )
-        else:
             safe_log_write(
                 log_file_handle,
-                f"REGULAR SUMMARY: '{title}' -> Image: '{image}', Href: '{href}', Mode: Regular\n",
+                f"Grid content length: {len(grid_content)} characters\n",
+            )
+
+            safe_log_write(
+                log_file_handle,
+                f"Generated grid content for '{title}':\n{'-' * 40}\n{grid_content}\n{'-' * 40}\n",
             )
 
+            if use_og:
+                safe_log_write(
+                    log_file_handle,
+                    f"AUTHOR PAGE SUMMARY: '{title}' -> Image: '{image}', Href: '{href}', Mode: OpenGraph\n",
+                )
+            else:
+                safe_log_write(
+                    log_file_handle,
+                    f"REGULAR SUMMARY: '{title}' -> Image: '{image}', Href: '{href}', Mode: Regular\n",
+                )
+
         if not grid_content or len(grid_content.strip()) < 50:
             safe_log_write(
                 log_file_handle,
                 f"WARNING: Generated grid content is too small or empty for '{title}' (length: {len(grid_content.strip()) if grid_content else 0}). Returning empty string.\n",
             )
-            if log_file_handle:
-                try:
-                    log_file_handle.close()
-                except:
-                    pass
             return ""
 
-        if log_file_handle:
-            try:
-                log_file_handle.close()
-            except:
-                pass
-
         return grid_content
 
     except Exception as template_error:
@@ -561,9 +578,4 @@ def generate_grid(ROCmBlogs, blog, lazy_load=False, use_og=False) -> str:
             log_file_handle,
             f"Template variables - title: '{title}', date: '{date}', description: '{description[:50]}...', authors_html: '{authors_html}', image: '{image}', href: '{href}'\n",
         )
-        if log_file_handle:
-            try:
-                log_file_handle.close()
-            except:
-                pass
         raise
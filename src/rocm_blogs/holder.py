@@ -244,7 +244,7 @@ class BlogHolder:
                     if author:
                         author = author.replace("\u202f", " ").replace("\u00a0", " ")
 
-                    category = blog.category if hasattr(blog, "category") else ""
+                    category = blog.category or ""
                     if category:
                         category = category.replace("\u202f", " ").replace(
                             "\u00a0", " "
@@ -710,7 +710,7 @@ class BlogHolder:
 
         log_message(
             "info",
-            "Clearing {blog_count} blogs from the blog holder",
+            f"Clearing {blog_count} blogs from the blog holder",
             "general",
             "holder",
         )
@@ -856,7 +856,7 @@ class BlogHolder:
                     log_file_handle.write(f"{vertical}: {count} blogs\n")
                     log_message(
                         "info",
-                        "Vertical '{vertical}' has {count} blogs",
+                        f"Vertical '{vertical}' has {count} blogs",
                         "general",
                         "holder",
                     )
@@ -868,7 +868,7 @@ class BlogHolder:
                         log_file_handle.write(f"  - {blog.blog_title}\n")
                         log_message(
                             "info",
-                            "Blog '{blog.blog_title}' belongs to vertical '{vertical}'",
+                            f"Blog '{blog.blog_title}' belongs to vertical '{vertical}'",
                             "general",
                             "holder",
                         )
@@ -896,17 +896,23 @@ class BlogHolder:
             self.blogs_categories[category] = []
             log_message("debug", f"Initialized category: {category}")
 
+        # Blogs are already in date order, so bucketing them in a single pass
+        # keeps each category sorted by date without sorting again
         category_counts = {}
         for blog in self.blogs.values():
-            if blog.category in categories:
-                self.blogs_categories[blog.category].append(blog)
-                category_counts[blog.category] = (
-                    category_counts.get(blog.category, 0) + 1
+            blog_category = blog.category
+            if not isinstance(blog_category, str):
+                continue
+            category_blogs = self.blogs_categories.get(blog_category)
+            if category_blogs is not None:
+                category_blogs.append(blog)
+                category_counts[blog_category] = (
+                    category_counts.get(blog_category, 0) + 1
                 )
 
         for category, count in category_counts.items():
             log_message(
-                "info", "Category '{category}' has {count} blogs", "general", "holder"
+                "info", f"Category '{category}' has {count} blogs", "general", "holder"
             )
 
         for category in categories:
@@ -46,7 +46,7 @@ def convert_to_webp(source_image_path):
     if file_extension.lower() in EXCLUDED_EXTENSIONS:
         log_message(
             "info",
-            "Skipping WebP conversion for excluded image format: {file_extension} for {source_image_path}",
+            f"Skipping WebP conversion for excluded image format: {file_extension} for {source_image_path}",
             "general",
             "images",
         )
@@ -82,7 +82,7 @@ def convert_to_webp(source_image_path):
                 )
                 log_message(
                     "info",
-                    "Resized banner image to {BANNER_DIMENSIONS[0]}x{BANNER_DIMENSIONS[1]}: {source_image_filename}",
+                    f"Resized banner image to {BANNER_DIMENSIONS[0]}x{BANNER_DIMENSIONS[1]}: {source_image_filename}",
                     "general",
                     "images",
                 )
@@ -97,7 +97,7 @@ def convert_to_webp(source_image_path):
                     new_width, new_height = webp_image.size
                     log_message(
                         "info",
-                        "Resized image from {original_width}x{original_height} to {new_width}x{new_height}: {source_image_filename}",
+                        f"Resized image from {original_width}x{original_height} to {new_width}x{new_height}: {source_image_filename}",
                         "general",
                         "images",
                     )
@@ -258,7 +258,7 @@ def _restore_from_backup(backup_image_path, source_image_path, source_image_file
     if os.path.exists(backup_image_path):
         log_message(
             "info",
-            "Restoring original image from backup for {source_image_filename}",
+            f"Restoring original image from backup for {source_image_filename}",
             "general",
             "images",
         )
@@ -292,7 +292,7 @@ def _handle_problematic_image(
     """Handle problematic images with more conservative optimization."""
     log_message(
         "info",
-        "Using conservative optimization for {source_image_filename}",
+        f"Using conservative optimization for {source_image_filename}",
         "general",
         "images",
     )
@@ -330,7 +330,7 @@ def _handle_problematic_image(
 
         log_message(
             "info",
-            "Conservative optimization completed for {source_image_filename} with WebP version",
+            f"Conservative optimization completed for {source_image_filename} with WebP version",
             "general",
             "images",
         )
@@ -362,7 +362,7 @@ def _create_webp_version(
     if file_extension in EXCLUDED_EXTENSIONS:
         log_message(
             "info",
-            "Skipping WebP conversion for excluded image format: {file_extension} for {original_image_path}",
+            f"Skipping WebP conversion for excluded image format: {file_extension} for {original_image_path}",
             "general",
             "images",
         )
@@ -447,7 +447,7 @@ def _process_image(
     if file_extension in EXCLUDED_EXTENSIONS:
         log_message(
             "info",
-            "Skipping optimization for excluded image format: {file_extension} for {source_image_path}",
+            f"Skipping optimization for excluded image format: {file_extension} for {source_image_path}",
             "general",
             "images",
         )
@@ -581,7 +581,7 @@ def _save_optimized_image(
             # skip GIF optimization
             log_message(
                 "info",
-                "Skipping optimization for {source_image_filename}",
+                f"Skipping optimization for {source_image_filename}",
                 "general",
                 "images",
             )
@@ -673,7 +673,7 @@ def optimize_generic_image(sphinx_app=None):
     if os.path.exists(static_generic_image_path):
         log_message(
             "info",
-            "Optimizing generic image in static directory: {static_generic_image_path}",
+            f"Optimizing generic image in static directory: {static_generic_image_path}",
             "general",
             "images",
         )
@@ -683,7 +683,7 @@ def optimize_generic_image(sphinx_app=None):
         if optimization_success and webp_image_path:
             log_message(
                 "info",
-                "Successfully optimized static generic image and created WebP version: {webp_image_path}",
+                f"Successfully optimized static generic image and created WebP version: {webp_image_path}",
                 "general",
                 "images",
             )
@@ -711,7 +711,7 @@ def optimize_generic_image(sphinx_app=None):
                 if os.path.exists(blogs_generic_image_path):
                     log_message(
                         "info",
-                        "Optimizing generic image in blogs directory: {blogs_generic_image_path}",
+                        f"Optimizing generic image in blogs directory: {blogs_generic_image_path}",
                         "general",
                         "images",
                     )
@@ -721,7 +721,7 @@ def optimize_generic_image(sphinx_app=None):
                     if optimization_success and webp_image_path:
                         log_message(
                             "info",
-                            "Successfully optimized blogs generic image and created WebP version: {webp_image_path}",
+                            f"Successfully optimized blogs generic image and created WebP version: {webp_image_path}",
                             "general",
                             "images",
                         )
@@ -752,25 +752,25 @@ def optimize_generic_image(sphinx_app=None):
     log_message("info", "-" * 80, "general", "images")
     log_message(
         "info",
-        "Total WebP conversions: {WEBP_CONVERSION_STATISTICS['converted']}",
+        f"Total WebP conversions: {WEBP_CONVERSION_STATISTICS['converted']}",
         "general",
         "images",
     )
     log_message(
         "info",
-        "Total WebP conversions skipped: {WEBP_CONVERSION_STATISTICS['skipped']}",
+        f"Total WebP conversions skipped: {WEBP_CONVERSION_STATISTICS['skipped']}",
         "general",
         "images",
     )
     log_message(
         "info",
-        "Total WebP conversions failed: {WEBP_CONVERSION_STATISTICS['failed']}",
+        f"Total WebP conversions failed: {WEBP_CONVERSION_STATISTICS['failed']}",
         "general",
         "images",
     )
     log_message(
         "info",
-        "Total original image size: {total_original_kb:.1f} KB",
+        f"Total original image size: {total_original_kb:.1f} KB",
         "general",
         "images",
     )
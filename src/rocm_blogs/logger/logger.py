@@ -5,14 +5,63 @@ This module provides a unified logging interface to eliminate code duplication
 and resolve circular dependency issues.
 """
 
+import atexit
+import logging
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..project.project_info import log_simple_message
 
+# Step log files are written through a large buffer and flushed when closed
+LOG_WRITE_BUFFER_SIZE = 1 << 20
+
+# Step log lines that are flushed straight away, so the buffered output that
+# leads up to a failure survives a crash or kill
+LOG_FLUSH_PREFIXES = ("ERROR", "Error", "CRITICAL", "Traceback")
+
+# Structured logger method used for each log_message level
+STRUCTURED_LOG_LEVELS = {
+    "debug": "debug",
+    "info": "info",
+    "warning": "warning",
+    "error": "error",
+    "critical": "error",
+}
+
+# Debug log records are queued and written to logs/rocm_blogs.log by a
+# background listener, so logging callers never wait on the file
+ROCM_BLOGS_LOG_MAX_BYTES = 10 << 20
+ROCM_BLOGS_LOG_BACKUP_COUNT = 3
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+_log_listener_lock = threading.Lock()
+_log_queue_handler = QueueHandler(_log_queue)
+_log_listener_atexit_registered = False
+_file_logger = logging.getLogger("rocm_blogs.file")
+_file_logger.setLevel(logging.DEBUG)
+_file_logger.propagate = False
+
+# Last formatted timestamp, reused for every call within the same second
+_cached_timestamp = (None, "")
+
+
+def current_timestamp() -> str:
+    """Return the local time as "YYYY-MM-DD HH:MM:SS", formatting it at most once per second."""
+    global _cached_timestamp
+    current_second = int(time.time())
+    cached_second, cached_text = _cached_timestamp
+    if current_second != cached_second:
+        cached_text = datetime.fromtimestamp(current_second).isoformat(sep=" ")
+        _cached_timestamp = (current_second, cached_text)
+    return cached_text
+
 
 def log_message(
     level: str,
@@ -26,41 +75,32 @@ def log_message(
         current_module = sys.modules.get("rocm_blogs") or sys.modules.get(
             "src.rocm_blogs"
         )
-        if (
-            hasattr(current_module, "structured_logger")
-            and current_module.structured_logger
-        ):
-            structured_logger = current_module.structured_logger
-
-            level_map = {
-                "debug": "debug",
-                "info": "info",
-                "warning": "warning",
-                "error": "error",
-                "critical": "error",
-            }
-
+        structured_logger = getattr(current_module, "structured_logger", None)
+        if structured_logger:
             log_method = getattr(
-                structured_logger, level_map.get(level.lower(), "info"), None
+                structured_logger,
+                STRUCTURED_LOG_LEVELS.get(level.lower(), "info"),
+                None,
             )
             if log_method:
                 log_method(message, operation, component, **kwargs)
                 return
 
-        if is_logging_enabled_from_config():
-            logs_dir = Path("logs")
-            logs_dir.mkdir(exist_ok=True)
-            rocm_blogs_log = logs_dir / "rocm_blogs.log"
+        # Skip all formatting and file I/O when logging is disabled
+        if not structured_logger and not _debug_logging_env_enabled():
+            return
 
-            from datetime import datetime
-
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            formatted_message = (
-                f"[{timestamp}] [{level.upper()}] [{component}:{operation}] {message}\n"
-            )
+        if _log_listener is None:
+            start_log_listener()
 
-            with open(rocm_blogs_log, "a", encoding="utf-8") as f:
-                f.write(formatted_message)
+        _file_logger.debug(
+            "[%s] [%s] [%s:%s] %s",
+            current_timestamp(),
+            level.upper(),
+            component,
+            operation,
+            message,
+        )
 
     except Exception:
         if level.lower() in ["error", "critical"]:
@@ -71,6 +111,50 @@ def log_message(
                 print(formatted_message, file=sys.stderr)
 
 
+def start_log_listener() -> None:
+    """Start the background thread writing queued records to logs/rocm_blogs.log."""
+    global _log_listener, _log_listener_atexit_registered
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+
+        logs_dir = Path("logs")
+        logs_dir.mkdir(exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            logs_dir / "rocm_blogs.log",
+            maxBytes=ROCM_BLOGS_LOG_MAX_BYTES,
+            backupCount=ROCM_BLOGS_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+        file_handler.setLevel(logging.DEBUG)
+
+        _file_logger.addHandler(_log_queue_handler)
+        _log_listener = QueueListener(
+            _log_queue, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+
+        if not _log_listener_atexit_registered:
+            atexit.register(stop_log_listener)
+            _log_listener_atexit_registered = True
+
+
+def stop_log_listener() -> None:
+    """Write out all queued records and close logs/rocm_blogs.log."""
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            return
+
+        _file_logger.removeHandler(_log_queue_handler)
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def create_step_log_file(step_name: str) -> tuple[Optional[str], Optional[Any]]:
     """Create log file for processing step only if logging is enabled."""
     try:
@@ -84,7 +168,9 @@ def create_step_log_file(step_name: str) -> tuple[Optional[str], Optional[Any]]:
         log_filename = f"{step_name}_{timestamp}.log"
         log_filepath = logs_dir / log_filename
 
-        log_file_handle = open(log_filepath, "w", encoding="utf-8")
+        log_file_handle = open(
+            log_filepath, "w", encoding="utf-8", buffering=LOG_WRITE_BUFFER_SIZE
+        )
 
         return str(log_filepath), log_file_handle
     except Exception:
@@ -92,11 +178,12 @@ def create_step_log_file(step_name: str) -> tuple[Optional[str], Optional[Any]]:
 
 
 def safe_log_write(file_handle: Optional[Any], message: str) -> None:
-    """Safely write message to log file."""
+    """Safely write message to log file; output is flushed on errors and on close."""
     if file_handle:
         try:
             file_handle.write(message)
-            file_handle.flush()
+            if message.startswith(LOG_FLUSH_PREFIXES):
+                file_handle.flush()
         except (OSError, IOError):
             pass
 
@@ -113,6 +200,15 @@ def safe_log_message(
             print(f"[WARNING] Logging system error: {log_error}")
 
 
+def safe_log_flush(file_handle: Optional[Any]) -> None:
+    """Safely flush buffered log output at a checkpoint in a long-running step."""
+    if file_handle:
+        try:
+            file_handle.flush()
+        except (OSError, IOError):
+            pass
+
+
 def safe_log_close(file_handle: Optional[Any]) -> None:
     """Safely close log file handle."""
     if file_handle:
@@ -134,6 +230,16 @@ def is_logging_enabled_from_config() -> bool:
         ):
             return True
 
-        return os.environ.get("ROCM_BLOGS_DEBUG", "").lower() in ("true", "1", "yes")
+        return _debug_logging_env_enabled()
     except Exception:
         return False
+
+
+def is_verbose_logging_enabled() -> bool:
+    """Check whether step logs should include a line for every blog."""
+    return os.environ.get("ROCM_BLOGS_VERBOSE_LOG", "").lower() in ("true", "1", "yes")
+
+
+def _debug_logging_env_enabled() -> bool:
+    """Check whether the ROCM_BLOGS_DEBUG environment variable enables logging."""
+    return os.environ.get("ROCM_BLOGS_DEBUG", "").lower() in ("true", "1", "yes")
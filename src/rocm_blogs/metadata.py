@@ -16,7 +16,7 @@ from rocm_blogs.constants import SUPPORTED_FORMATS
 from .logger.logger import (create_step_log_file,
                             is_logging_enabled_from_config, log_message,
                             safe_log_close, safe_log_write)
-from .utils import calculate_day_of_week
+from .utils import calculate_day_of_week, write_file_if_changed
 
 # Blog classification constants
 PRIMARY_TAGS = {
@@ -424,7 +424,7 @@ myst:
             try:
                 log_message(
                     "info",
-                    "Processing {blog_identifier}: {current_blog_path.name}",
+                    f"Processing {blog_identifier}: {current_blog_path.name}",
                     "general",
                     "metadata",
                 )
@@ -467,7 +467,7 @@ myst:
                 if not metadata_match:
                     log_message(
                         "info",
-                        "Skipping {blog_identifier}: No metadata section found, not a blog post",
+                        f"Skipping {blog_identifier}: No metadata section found, not a blog post",
                         "general",
                         "metadata",
                     )
@@ -543,7 +543,7 @@ myst:
                 if not extracted_metadata.get("blogpost"):
                     log_message(
                         "info",
-                        "Skipping {blog_identifier}: Not marked as a blog post in extracted metadata",
+                        f"Skipping {blog_identifier}: Not marked as a blog post in extracted metadata",
                         "general",
                         "metadata",
                     )
@@ -604,8 +604,7 @@ myst:
                             metadata_log_file_handle, f"Keywords: {blog_keywords}\n"
                         )
 
-                    title_regex_pattern = re.compile(r"^# (.+)$", re.MULTILINE)
-                    title_match = title_regex_pattern.search(blog_file_content)
+                    title_match = TITLE_REGEX_PATTERN.search(blog_file_content)
                     if title_match:
                         extracted_title = title_match.group(1)
                         extracted_title = extracted_title.replace('"', "'")
@@ -689,7 +688,7 @@ myst:
                     if not extracted_metadata.get("thumbnail"):
                         log_message(
                             "info",
-                            "Blog: {blog_filepath} does not have a thumbnail specified: {extracted_metadata}",
+                            f"Blog: {blog_filepath} does not have a thumbnail specified: {extracted_metadata}",
                             "general",
                             "metadata",
                         )
@@ -1276,10 +1275,7 @@ myst:
                     continue
 
                 try:
-                    metadata_regex_pattern = re.compile(
-                        r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL
-                    )
-                    match = metadata_regex_pattern.search(blog_file_content)
+                    match = METADATA_REGEX_PATTERN.search(blog_file_content)
                     if match:
                         # Use string slicing instead of regex substitution to avoid escape sequence issues
                         blog_file_content = (
@@ -1310,13 +1306,17 @@ myst:
                             metadata_log_file_handle, f"Added new metadata\n"
                         )
                     blog_file_content = blog_file_content.strip() + "\n"
-                    with open(
-                        blog_filepath, "w", encoding="utf-8", errors="replace"
-                    ) as blog_file_handle_write:
-                        blog_file_handle_write.write(blog_file_content)
+                    # Leave an unchanged README alone so its mtime stays
+                    # stable for the incremental index check.
+                    write_file_if_changed(
+                        blog_filepath,
+                        blog_file_content.replace("\n", os.linesep).encode(
+                            "utf-8", errors="replace"
+                        ),
+                    )
                     log_message(
                         "info",
-                        "Metadata successfully added to {blog_filepath}",
+                        f"Metadata successfully added to {blog_filepath}",
                         "general",
                         "metadata",
                     )
@@ -1,13 +1,15 @@
 import importlib.resources as pkg_resources
 import inspect
+import itertools
 import json
 import os
 import re
 import shutil
+import string
 import threading
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
@@ -130,6 +132,79 @@ def _create_pagination_controls(
     )
 
 
+def _compile_page_template(template, **fixed_fields):
+    """Pre-parse a page template, filling in fields that are the same on every page."""
+    segments = []
+    for literal_text, field_name, _, _ in string.Formatter().parse(template):
+        if field_name in fixed_fields:
+            literal_text += str(fixed_fields[field_name])
+            field_name = None
+
+        if segments and segments[-1][1] is None:
+            segments[-1] = (segments[-1][0] + literal_text, field_name)
+        else:
+            segments.append((literal_text, field_name))
+
+    return segments
+
+
+def _render_page_template(segments, **fields):
+    """Render a template compiled by _compile_page_template to a string."""
+    return "".join(
+        literal_text if field_name is None else literal_text + str(fields[field_name])
+        for literal_text, field_name in segments
+    )
+
+
+def _write_page_file(output_path, segments, **fields):
+    """Write one generated page from a compiled template and return its path.
+
+    Pages whose content is unchanged are left alone, so Sphinx does not treat
+    them as modified and re-read them on incremental builds. The build
+    timestamp is not compared, so an unchanged page keeps its old one.
+    """
+    write_file_if_changed(
+        output_path,
+        _render_page_template(segments, **fields).encode("utf-8"),
+        GENERATED_TIMESTAMP_PATTERN,
+    )
+
+    return output_path
+
+
+def _write_page_files(page_jobs):
+    """Write generated pages concurrently while later pages are still being built.
+
+    Each job is a (key, output_path, segments, fields) tuple, and page_jobs
+    may be a generator that builds each page as it is asked for. Jobs are
+    only taken from it while fewer than max_pending writes are outstanding,
+    so just the pages waiting on a write hold their HTML. Yields
+    (key, output_path) for every page as soon as it has been written.
+    Rendering is cheap next to the file writes, which release the GIL, so
+    the pool is sized for I/O rather than for the number of CPUs.
+    """
+    page_jobs = iter(page_jobs)
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    max_pending = max_workers * 2
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        page_futures = {}
+        while True:
+            for key, output_path, segments, fields in itertools.islice(
+                page_jobs, max_pending - len(page_futures)
+            ):
+                page_futures[
+                    executor.submit(_write_page_file, output_path, segments, **fields)
+                ] = key
+
+            if not page_futures:
+                break
+
+            done_futures, _ = wait(page_futures, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                yield page_futures.pop(future), future.result()
+
+
 def _process_category(
     category_info,
     rocm_blogs,
@@ -206,7 +281,7 @@ def _process_category(
 
                     # Get blog field value
                     if field == "category":
-                        blog_value = getattr(blog, "category", "")
+                        blog_value = blog.category or ""
                         if blog_value not in values:
                             matches_all_criteria = False
                             log_message(
@@ -251,8 +326,8 @@ def _process_category(
                             html_meta = myst_data.get("html_meta", {})
                             vertical_str = html_meta.get("vertical", "")
 
-                            if not vertical_str and hasattr(blog, "vertical"):
-                                vertical_str = getattr(blog, "vertical", "")
+                            if not vertical_str:
+                                vertical_str = blog.vertical or ""
 
                             # Split vertical string into list and strip
                             # whitespace
@@ -568,8 +643,7 @@ def _process_category(
             )
 
         try:
-            with output_path.open("w", encoding="utf-8") as output_file:
-                output_file.write(final_content)
+            output_path.write_bytes(final_content.encode("utf-8"))
 
             if log_file_handle:
                 log_file_handle.write(f"Successfully wrote to file {output_path}\n")
@@ -634,11 +708,37 @@ def _process_category(
         )
 
 
+def _cached_grid_item(grid_cache, rocm_blogs, blog, use_og, log_file_handle=None):
+    """Generate a blog's grid item, reusing any HTML already in the grid cache."""
+    if grid_cache is None:
+        return generate_grid(rocm_blogs, blog, False, use_og, log_file_handle)
+
+    cache_key = (id(blog), use_og)
+    grid_html = grid_cache.get(cache_key)
+    if grid_html is None:
+        grid_html = generate_grid(rocm_blogs, blog, False, use_og, log_file_handle)
+        grid_cache[cache_key] = grid_html
+    return grid_html
+
+
 def _generate_grid_items(
-    rocm_blogs, blog_list, max_items, used_blogs, skip_used=False, use_og=False
+    rocm_blogs,
+    blog_list,
+    max_items,
+    used_blogs,
+    skip_used=False,
+    use_og=False,
+    grid_cache=None,
 ):
-    """Generate grid items in parallel using thread pool."""
+    """Generate grid items in parallel using thread pool.
 
+    When a grid_cache dict is given, each blog is rendered at most once per
+    cache, so a build phase that shows the same blog in several grids can
+    share one cache across its calls.
+    """
+
+    # Every grid item in the batch writes to the same grid log handle
+    grid_log_handle = open_grid_log()
     try:
         # Debug: Log the parameters received by this function
         log_message(
@@ -685,6 +785,14 @@ def _generate_grid_items(
                 "process",
             )
 
+        # Index the used blogs by ID and file path for constant-time lookups
+        used_blog_ids = set()
+        used_blog_paths = set()
+        if skip_used:
+            for used_blog in used_blogs:
+                used_blog_ids.add(id(used_blog))
+                used_blog_paths.add(getattr(used_blog, "file_path", None))
+
         # Generate grid items in parallel with proper deduplication
         with ThreadPoolExecutor() as executor:
             grid_futures = {}
@@ -698,13 +806,10 @@ def _generate_grid_items(
                 already_used = False
                 if skip_used:
                     # Check by object ID
-                    if any(id(used_blog) == blog_id for used_blog in used_blogs):
+                    if blog_id in used_blog_ids:
                         already_used = True
                     # Also check by file path as backup
-                    elif blog_path and any(
-                        getattr(used_blog, "file_path", None) == blog_path
-                        for used_blog in used_blogs
-                    ):
+                    elif blog_path and blog_path in used_blog_paths:
                         already_used = True
 
                 if already_used:
@@ -729,10 +834,17 @@ def _generate_grid_items(
                 # Add to used_blogs list if skip_used is enabled
                 if skip_used:
                     used_blogs.append(blog_entry)
+                    used_blog_ids.add(blog_id)
+                    used_blog_paths.add(blog_path)
 
                 grid_futures[
                     executor.submit(
-                        generate_grid, rocm_blogs, blog_entry, False, use_og
+                        _cached_grid_item,
+                        grid_cache,
+                        rocm_blogs,
+                        blog_entry,
+                        use_og,
+                        grid_log_handle,
                     )
                 ] = blog_entry
                 item_count += 1
@@ -855,10 +967,44 @@ def _generate_grid_items(
             "process",
         )
         return []
+    finally:
+        safe_log_close(grid_log_handle)
+
+
+# Lazy grid items are rendered on one bounded pool shared by every call, since
+# categories and verticals build their pages concurrently
+_lazy_grid_executor = None
+_lazy_grid_executor_lock = threading.Lock()
+
+
+def _get_lazy_grid_executor():
+    """Return the shared lazy grid item thread pool, creating it on first use."""
+    global _lazy_grid_executor
+    with _lazy_grid_executor_lock:
+        if _lazy_grid_executor is None:
+            _lazy_grid_executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 4) * 4),
+                thread_name_prefix="lazy-grid",
+            )
+        return _lazy_grid_executor
+
+
+def _lazy_grid_item(rocm_blogs, blog, log_file_handle=None):
+    """Return the lazy-loaded grid HTML for a blog, generating it on first use."""
+    grid_html = getattr(blog, "_lazy_grid_html", None)
+    if grid_html is None:
+        grid_html = generate_grid(
+            rocm_blogs, blog, lazy_load=True, log_file_handle=log_file_handle
+        )
+        blog._lazy_grid_html = grid_html
+    return grid_html
 
 
 def _generate_lazy_loaded_grid_items(rocm_blogs, blog_list):
     """Generate grid items with lazy loading and thread-safe deduplication."""
+    # Every grid item in the batch writes to the same grid log handle
+    grid_log_handle = open_grid_log()
+    grid_futures = {}
     try:
         lazy_grid_items = []
         error_count = 0
@@ -910,10 +1056,30 @@ def _generate_lazy_loaded_grid_items(rocm_blogs, blog_list):
                 skip_used=False,
             )
 
+        # Render the blogs without a cached grid item concurrently; like
+        # _generate_grid_items, generate_grid mostly waits on file checks
+        uncached_blogs = [
+            blog_entry
+            for blog_entry in deduplicated_blog_list
+            if getattr(blog_entry, "_lazy_grid_html", None) is None
+        ]
+        if len(uncached_blogs) > 1:
+            executor = _get_lazy_grid_executor()
+            grid_futures = {
+                id(blog_entry): executor.submit(
+                    _lazy_grid_item, rocm_blogs, blog_entry, grid_log_handle
+                )
+                for blog_entry in uncached_blogs
+            }
+
         # Generate grid items with lazy loading
         for blog_entry in deduplicated_blog_list:
             try:
-                grid_html = generate_grid(rocm_blogs, blog_entry, lazy_load=True)
+                grid_future = grid_futures.get(id(blog_entry))
+                if grid_future is not None:
+                    grid_html = grid_future.result()
+                else:
+                    grid_html = _lazy_grid_item(rocm_blogs, blog_entry, grid_log_handle)
                 if not grid_html or not grid_html.strip():
                     error_count += 1
                     log_message(
@@ -975,6 +1141,10 @@ def _generate_lazy_loaded_grid_items(rocm_blogs, blog_list):
         raise ROCmBlogsError(
             f"Error generating lazy-loaded grid-items: {lazy_load_error}"
         ) from lazy_load_error
+    finally:
+        # Let every submitted render finish before its log handle is closed
+        wait(grid_futures.values())
+        safe_log_close(grid_log_handle)
 
 
 def process_single_blog(blog_entry, rocm_blogs):
@@ -1145,7 +1315,7 @@ def process_single_blog(blog_entry, rocm_blogs):
                 blog_entry.date.strftime("%B %d, %Y") if blog_entry.date else "No Date"
             )
             blog_language = getattr(blog_entry, "language", "en")
-            blog_category = getattr(blog_entry, "category", "blog")
+            blog_category = blog_entry.category or "blog"
             blog_tags = getattr(blog_entry, "tags", "")
             # Extract market verticals from metadata or auto-assign from tags
             market_verticals = []
@@ -0,0 +1,53 @@
+"""
+Tests for the generated section of author pages.
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rocm_blogs import _author_grid_inputs_digest, _split_author_page
+from rocm_blogs.constants import AUTHOR_GRID_MARKER, AUTHOR_TEMPLATE
+
+
+def test_split_author_page_without_generated_section():
+    author_content = "# Jane Doe\n\nBio.\n"
+
+    assert _split_author_page(author_content) == (author_content, None)
+
+
+def test_split_author_page_returns_handwritten_part_and_digest():
+    author_content = "# Jane Doe\n\nBio.\n"
+    generated_page = (
+        author_content
+        + "\n"
+        + AUTHOR_GRID_MARKER.format(digest="0123abcd")
+        + AUTHOR_TEMPLATE
+    )
+
+    assert _split_author_page(generated_page) == (author_content, "0123abcd")
+
+
+def test_author_grid_inputs_digest_tracks_content_not_mtimes(tmp_path):
+    readme_path = tmp_path / "post-a" / "README.md"
+    readme_path.parent.mkdir()
+    readme_path.write_text("# Post A\n", encoding="utf-8")
+    author_blogs = [SimpleNamespace(file_path=str(readme_path))]
+    digest = _author_grid_inputs_digest(author_blogs, str(tmp_path), "css")
+
+    os.utime(readme_path, ns=(10**9, 10**9))
+    assert _author_grid_inputs_digest(author_blogs, str(tmp_path), "css") == digest
+
+    (readme_path.parent / "images").mkdir()
+    (readme_path.parent / "images" / "thumbnail.webp").write_bytes(b"")
+    with_image_digest = _author_grid_inputs_digest(author_blogs, str(tmp_path), "css")
+    assert with_image_digest != digest
+
+    readme_path.write_text("# Post A, edited\n", encoding="utf-8")
+    assert (
+        _author_grid_inputs_digest(author_blogs, str(tmp_path), "css")
+        != with_image_digest
+    )
@@ -0,0 +1,62 @@
+"""
+Tests for the index phase input digest.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rocm_blogs
+from rocm_blogs import _index_inputs_digest
+
+
+def _make_blogs_directory(tmp_path):
+    blogs_directory = tmp_path / "blogs"
+    post_directory = blogs_directory / "ai" / "post-a"
+    post_directory.mkdir(parents=True)
+    readme_path = post_directory / "README.md"
+    readme_path.write_text("# Post A\n", encoding="utf-8")
+    (blogs_directory / "authors").mkdir()
+    (blogs_directory / "authors" / "jane-doe.md").write_text("# Jane\n")
+    return blogs_directory, readme_path
+
+
+def _readme_stats(readme_path):
+    readme_stat = os.stat(readme_path)
+    return {str(readme_path): (readme_stat.st_mtime_ns, readme_stat.st_size)}
+
+
+def test_index_inputs_digest_is_stable_for_unchanged_inputs(tmp_path):
+    blogs_directory, readme_path = _make_blogs_directory(tmp_path)
+    readme_stats = _readme_stats(readme_path)
+
+    assert _index_inputs_digest(blogs_directory, readme_stats) == (
+        _index_inputs_digest(blogs_directory, dict(readme_stats))
+    )
+
+
+def test_index_inputs_digest_changes_with_its_inputs(tmp_path, monkeypatch):
+    blogs_directory, readme_path = _make_blogs_directory(tmp_path)
+    readme_stats = _readme_stats(readme_path)
+    digests = {_index_inputs_digest(blogs_directory, readme_stats)}
+
+    # An edited README
+    readme_path.write_text("# Post A, edited\n", encoding="utf-8")
+    readme_stats = _readme_stats(readme_path)
+    digests.add(_index_inputs_digest(blogs_directory, readme_stats))
+
+    # A new author page
+    (blogs_directory / "authors" / "john-smith.md").write_text("# John\n")
+    digests.add(_index_inputs_digest(blogs_directory, readme_stats))
+
+    # A new featured blogs list
+    (blogs_directory / "featured-blogs.csv").write_text("Post A\n")
+    digests.add(_index_inputs_digest(blogs_directory, readme_stats))
+
+    # A different package version
+    monkeypatch.setattr(rocm_blogs, "__version__", "0.0.0-test")
+    digests.add(_index_inputs_digest(blogs_directory, readme_stats))
+
+    assert len(digests) == 5
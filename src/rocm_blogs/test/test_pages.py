@@ -0,0 +1,90 @@
+"""
+Tests for the paginated page helpers.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rocm_blogs import _iter_page_grid_items
+from rocm_blogs.constants import POSTS_TEMPLATE
+from rocm_blogs.process import (
+    _compile_page_template,
+    _write_page_file,
+    _write_page_files,
+)
+from rocm_blogs.utils import import_file
+
+
+def test_iter_page_grid_items_pagination_boundaries():
+    assert list(_iter_page_grid_items([], 3)) == []
+    assert list(_iter_page_grid_items(["a", "b", "c"], 3)) == [["a", "b", "c"]]
+    assert list(_iter_page_grid_items(["a", "b", "c", "d"], 3)) == [
+        ["a", "b", "c"],
+        ["d"],
+    ]
+    assert list(_iter_page_grid_items(iter("abc"), 1)) == [["a"], ["b"], ["c"]]
+
+
+def test_write_page_files_writes_pages_as_they_are_built(tmp_path):
+    """Jobs are pulled from the generator lazily and every page is written once."""
+    segments = [("<main>", "HTML"), ("</main>\n", None)]
+    page_count = 200
+    built_pages = []
+
+    def build_page_jobs():
+        for page_num in range(1, page_count + 1):
+            built_pages.append(page_num)
+            yield (
+                page_num,
+                tmp_path / f"page{page_num}.md",
+                segments,
+                {"HTML": f"page {page_num}"},
+            )
+
+    written = {}
+    built_before_first_write = None
+    for page_num, output_path in _write_page_files(build_page_jobs()):
+        if built_before_first_write is None:
+            built_before_first_write = len(built_pages)
+        written[page_num] = output_path
+
+    assert built_before_first_write < page_count
+    assert sorted(written) == list(range(1, page_count + 1))
+    for page_num, output_path in written.items():
+        assert output_path.read_text() == f"<main>page {page_num}</main>\n"
+
+
+def test_write_page_file_keeps_a_page_that_only_differs_in_its_timestamp(tmp_path):
+    """Rendering the same posts page twice leaves the first file in place."""
+    template_html = import_file("rocm_blogs.templates", "posts.html")
+    segments = _compile_page_template(POSTS_TEMPLATE, CSS="", PAGINATION_CSS="")
+    output_path = tmp_path / "posts.md"
+
+    def write_page(timestamp, grid_items):
+        page_html = template_html.replace("{datetime}", timestamp).replace(
+            "{grid_items}", grid_items
+        )
+        _write_page_file(
+            output_path,
+            segments,
+            HTML=page_html,
+            page_title_suffix="",
+            page_description_suffix="",
+            current_page=1,
+            pagination_controls="",
+        )
+
+    write_page("2025-03-05 10:00:00", "<div>Post A</div>")
+    first_content = output_path.read_bytes()
+    os.utime(output_path, ns=(10**9, 10**9))
+
+    write_page("2025-03-06 11:30:00", "<div>Post A</div>")
+    assert output_path.read_bytes() == first_content
+    assert output_path.stat().st_mtime_ns == 10**9
+
+    write_page("2025-03-06 11:30:00", "<div>Post B</div>")
+    assert b"Generated 2025-03-06 11:30:00" in output_path.read_bytes()
+    assert b"Post B" in output_path.read_bytes()
@@ -0,0 +1,56 @@
+"""
+Tests for the README scan in rocm_blogs._rocmblogs.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rocm_blogs._rocmblogs import ROCmBlogs
+
+
+def _recursive_readme_walk(directory, readme_paths):
+    """Reference recursive walk that _scan_readme_files must match."""
+    with os.scandir(directory) as entries:
+        subdirectories = []
+        for entry in entries:
+            if entry.name == "README.md" and entry.is_file():
+                readme_paths.append(entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+    for subdirectory in subdirectories:
+        _recursive_readme_walk(subdirectory, readme_paths)
+    return readme_paths
+
+
+def _write_readme(directory):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "README.md").write_text(f"# {directory.name}\n", encoding="utf-8")
+
+
+def test_scan_readme_files_matches_recursive_walk_order(tmp_path):
+    """READMEs are recorded depth first, in the same order as a recursive walk."""
+    for relative_path in (
+        ".",
+        "ai/post-a",
+        "ai/post-b",
+        "ai/post-b/nested",
+        "hpc/post-c",
+        "hpc/empty/deeper/post-d",
+        "software-tools/post-e",
+    ):
+        _write_readme(tmp_path / relative_path)
+    (tmp_path / "ai" / "post-a" / "notes.md").write_text("not a README\n")
+
+    readme_stats = {}
+    ROCmBlogs()._scan_readme_files(str(tmp_path), readme_stats)
+
+    expected_paths = _recursive_readme_walk(str(tmp_path), [])
+    assert list(readme_stats) == expected_paths
+    assert len(expected_paths) == 7
+
+    for readme_path, (mtime_ns, size) in readme_stats.items():
+        readme_stat = os.stat(readme_path)
+        assert (mtime_ns, size) == (readme_stat.st_mtime_ns, readme_stat.st_size)
@@ -0,0 +1,41 @@
+"""
+Tests for the file helpers in rocm_blogs.utils.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rocm_blogs.utils import write_file_if_changed
+
+
+def test_write_file_if_changed_creates_missing_file(tmp_path):
+    """A file that does not exist yet is written."""
+    output_path = tmp_path / "page.md"
+
+    assert write_file_if_changed(output_path, b"# Page\n")
+    assert output_path.read_bytes() == b"# Page\n"
+
+
+def test_write_file_if_changed_leaves_unchanged_file_alone(tmp_path):
+    """A file that already holds the content is not rewritten."""
+    output_path = tmp_path / "page.md"
+    output_path.write_bytes(b"# Page\n")
+    os.utime(output_path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert not write_file_if_changed(str(output_path), b"# Page\n")
+    assert output_path.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_write_file_if_changed_rewrites_changed_file(tmp_path):
+    """A file is rewritten when its content differs, with or without a size change."""
+    output_path = tmp_path / "page.md"
+    output_path.write_bytes(b"# Page\n")
+
+    assert write_file_if_changed(output_path, b"# Edit\n")
+    assert output_path.read_bytes() == b"# Edit\n"
+
+    assert write_file_if_changed(output_path, b"# Longer page\n")
+    assert output_path.read_bytes() == b"# Longer page\n"
@@ -1,3 +1,4 @@
+import functools
 import importlib.resources as pkg_resources
 import traceback
 from datetime import datetime
@@ -18,8 +19,9 @@ class ROCmBlogsError(SphinxError):
     category = "ROCm Blogs Error"
 
 
+@functools.lru_cache(maxsize=None)
 def import_file(package: str, resource: str) -> str:
-    """Important file imports as part of the pypi package."""
+    """Important file imports as part of the pypi package; cached per resource."""
     try:
         log_message("debug", f"Importing file {resource} from package {package}")
         content = pkg_resources.read_text(package, resource)
@@ -38,6 +40,31 @@ def import_file(package: str, resource: str) -> str:
         ) from error
 
 
+def write_file_if_changed(output_path, content: bytes, ignore_pattern=None) -> bool:
+    """Write content to a file unless it already holds exactly those bytes.
+
+    Bytes matched by ignore_pattern, a compiled bytes regex, are left out of
+    the comparison, so a file that differs only there keeps its old content.
+    """
+    output_path = Path(output_path)
+    try:
+        # Sizes differ for almost every real change, so most files are not read
+        if output_path.stat().st_size == len(content):
+            existing_content = output_path.read_bytes()
+            if ignore_pattern is not None:
+                existing_content = ignore_pattern.sub(b"", existing_content)
+                content_to_compare = ignore_pattern.sub(b"", content)
+            else:
+                content_to_compare = content
+            if existing_content == content_to_compare:
+                return False
+    except FileNotFoundError:
+        pass
+
+    output_path.write_bytes(content)
+    return True
+
+
 def truncate_string(input_string: str) -> str:
     """Convert a string to a URL-friendly slug format."""
     try: